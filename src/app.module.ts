@@ -1,4 +1,4 @@
-import { Module } from '@nestjs/common';
+import { Logger, Module } from '@nestjs/common';
 import { ConfigModule } from '@nestjs/config';
 import { ScheduleModule } from '@nestjs/schedule';
 
@@ -9,11 +9,27 @@ import { VaultModule } from './modules/vault/vault.module';
 import { ToolsModule } from './modules/tools/tools.module';
 import { NotificationsModule } from './modules/notifications/notifications.module';
 
+/**
+ * Decide whether the .env file should be parsed at startup. In production the
+ * environment is expected to come from the orchestrator, so parsing is skipped.
+ */
+function shouldLoadEnvFile(): boolean {
+  const nodeEnv = process.env.NODE_ENV;
+  if (process.env.DOTENV_DISABLE === '1' || nodeEnv === 'production' || nodeEnv === 'prod') {
+    new Logger('AppModule').debug(`Skipping .env file (NODE_ENV=${nodeEnv ?? 'unset'})`);
+    return false;
+  }
+  return true;
+}
+
 @Module({
   imports: [
     ConfigModule.forRoot({
       isGlobal: true,
       envFilePath: '.env',
+      ignoreEnvFile: !shouldLoadEnvFile(),
+      // Keep resolved values in memory instead of re-reading process.env on every get()
+      cache: true,
     }),
     ScheduleModule.forRoot(),
     NotificationsModule,
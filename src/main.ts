@@ -3,7 +3,12 @@ import { AppModule } from './app.module';
 import { ConfigService } from './shared/infrastructure/config/config.service';
 
 async function bootstrap() {
-  const app = await NestFactory.create(AppModule);
+  // Debug and verbose output (raw LLM responses, per-task traces) is for development only
+  const app = await NestFactory.create(AppModule, {
+    logger: process.env.NODE_ENV === 'production' ? ['log', 'warn', 'error', 'fatal'] : undefined,
+  });
+  // Run onModuleDestroy hooks on SIGTERM/SIGINT so pending history writes are flushed
+  app.enableShutdownHooks();
   const configService = app.get(ConfigService);
 
   const port = configService.getPort() || 3000;
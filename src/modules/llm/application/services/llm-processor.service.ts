@@ -1,10 +1,13 @@
 import { Injectable, Inject, Logger, forwardRef } from '@nestjs/common';
-import { ConfigService } from '@nestjs/config';
 import { ToolsRegistryService } from '../../../tools/application/services/tools-registry.service';
 import { GoogleGenaiAdapter } from '../../infrastructure/adapters/google-genai.adapter';
-import { PromptBuilderService } from '../../../../shared/infrastructure/services/prompt-builder.service';
+import {
+  PromptBuilderService,
+  PROMPT_HISTORY_LIMIT,
+} from '../../../../shared/infrastructure/services/prompt-builder.service';
 import { HistoryService } from '../../../../shared/infrastructure/persistence/history.service';
 import { HistoryEntry } from '../../../../shared/domain/models/history-entry.model';
+import { ConfigService } from '../../../../shared/infrastructure/config/config.service';
 
 export interface LlmResponse {
   toolCalls: any[];
@@ -14,6 +17,7 @@ export interface LlmResponse {
 @Injectable()
 export class LlmProcessorService {
   private readonly logger = new Logger(LlmProcessorService.name);
+  private toolCallsSchema: Record<string, any> | null = null;
 
   constructor(
     private readonly configService: ConfigService,
@@ -30,8 +34,8 @@ export class LlmProcessorService {
     vaultContext?: string,
   ): Promise<LlmResponse> {
     try {
-      // Get user's message history
-      const history = this.historyService.getHistory();
+      // Get the part of the user's message history that goes into the prompt
+      const history = this.historyService.getRecentHistory(PROMPT_HISTORY_LIMIT);
 
       // Build system prompt with vault context and tools
       let systemPrompt = this.promptBuilder.buildSystemPrompt(history, vaultContext);
@@ -51,6 +55,9 @@ export class LlmProcessorService {
       const response = await this.googleGenaiAdapter.generateContent(
         [{ text: message }],
         systemPrompt,
+        undefined,
+        undefined,
+        this.getToolCallsSchema(),
       );
 
       if (!response) {
@@ -97,6 +104,20 @@ export class LlmProcessorService {
             return false;
           }
 
+          // An empty reply or a file without content is worse than no call at all
+          const definition = this.toolsRegistry
+            .getToolDefinitions()
+            .find((toolDefinition) => toolDefinition.name === tool);
+          const missingParams = (definition?.required ?? []).filter(
+            (name) => params[name] === undefined || params[name] === null,
+          );
+          if (missingParams.length > 0) {
+            this.logger.warn(
+              `Invalid tool call for ${tool}: missing required params ${missingParams.join(', ')}`,
+            );
+            return false;
+          }
+
           return true;
         });
 
@@ -168,6 +189,40 @@ export class LlmProcessorService {
     }
   }
 
+  /**
+   * Response schema for an array of tool calls. Gemini only produces output matching it,
+   * so the reply names a registered tool; required params are checked before dispatch
+   */
+  private getToolCallsSchema(): Record<string, any> {
+    if (this.toolCallsSchema) {
+      return this.toolCallsSchema;
+    }
+
+    // A single flat object type covers every tool's params; per-tool item shapes would need
+    // anyOf, which a rejected schema would turn into a failure for every message. Each
+    // tool's own required params are checked against its definition in processUserMessage
+    const toolDefinitions = this.toolsRegistry.getToolDefinitions();
+    const paramProperties: Record<string, any> = {};
+    for (const definition of toolDefinitions) {
+      for (const [name, property] of Object.entries(definition.parameters.properties)) {
+        paramProperties[name] ??= { type: 'STRING', description: property.description };
+      }
+    }
+
+    this.toolCallsSchema = {
+      type: 'ARRAY',
+      items: {
+        type: 'OBJECT',
+        properties: {
+          tool: { type: 'STRING', enum: toolDefinitions.map((definition) => definition.name) },
+          data: { type: 'OBJECT', properties: paramProperties },
+        },
+        required: ['tool', 'data'],
+      },
+    };
+    return this.toolCallsSchema;
+  }
+
   private addStrictFormattingInstructions(systemPrompt: string): string {
     const strictFormatInstructions = `
 CRITICAL INSTRUCTION: Your response MUST ALWAYS be a valid JSON array of tool calls, NEVER plain text.
@@ -210,6 +265,7 @@ Remember:
 
     // Clean up the text - remove any text before and after the array
     // This is critical for handling cases where the LLM includes explanations
+    // or wraps the array in a ```json fence
     let cleanedText = text.trim();
 
     // Find the first '[' and last ']' to extract the array
@@ -227,19 +283,18 @@ Remember:
       if (Array.isArray(parsedJson)) {
         for (const item of parsedJson) {
           if (item && typeof item === 'object') {
-            // Support both "data" and "params" keys for compatibility
+            // Support both "data" and "params" keys for compatibility; tools without
+            // params may leave both out, required params are checked by the caller
             const toolName = item.tool;
-            const toolParams = item.data || item.params;
+            const toolParams = item.data || item.params || {};
 
-            if (toolName && toolParams) {
+            if (toolName) {
               toolCalls.push({
                 tool: toolName,
                 params: toolParams,
               });
             } else {
-              this.logger.warn(
-                `Item in JSON array missing required fields: ${JSON.stringify(item)}`,
-              );
+              this.logger.warn(`Item in JSON array missing tool name: ${JSON.stringify(item)}`);
             }
           }
         }
@@ -267,10 +322,10 @@ Remember:
               const parsedJson = JSON.parse(jsonMatch);
               if (Array.isArray(parsedJson)) {
                 for (const item of parsedJson) {
-                  if (item.tool && (item.data || item.params)) {
+                  if (item?.tool) {
                     toolCalls.push({
                       tool: item.tool,
-                      params: item.data || item.params,
+                      params: item.data || item.params || {},
                     });
                   }
                 }
@@ -16,16 +16,9 @@ export interface ILLMService {
     maxOutputTokens?: number,
   ): Promise<GenerativeContentResponse | null>;
 
-  callSync(
-    contents: any[],
-    systemInstruction?: string,
-    responseMimeType?: string,
-    maxOutputTokens?: number,
-  ): GenerativeContentResponse | null;
-
-  uploadFile(filePath: string): GenerativeFile | null;
+  uploadFile(filePath: string): Promise<GenerativeFile | null>;
 
   deleteFile(fileName: string): boolean;
 
-  transcribeAudio(audioFilePath: string): string | null;
+  transcribeAudioAsync(audioFilePath: string): Promise<string | null>;
 }
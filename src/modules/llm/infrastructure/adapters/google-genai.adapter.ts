@@ -4,12 +4,35 @@ import {
   GenerativeContentResponse,
   GenerativeFile,
 } from '../../domain/interfaces/llm-service.interface';
-import { GoogleGenAI, createUserContent, createPartFromUri } from '@google/genai';
-import * as fs from 'fs';
+import type { GoogleGenAI } from '@google/genai';
+import * as fs from 'fs/promises';
+import * as path from 'path';
+
+// Audio MIME types by file extension, looked up once per file instead of probing each suffix
+const AUDIO_MIME_TYPES: ReadonlyMap<string, string> = new Map([
+  ['.mp3', 'audio/mp3'],
+  ['.wav', 'audio/wav'],
+  ['.ogg', 'audio/ogg'],
+  ['.aac', 'audio/aac'],
+  ['.flac', 'audio/flac'],
+  ['.aiff', 'audio/aiff'],
+]);
+
+// Default to a reasonable token limit
+const DEFAULT_MAX_OUTPUT_TOKENS = 1000000;
+
+// Generation config to prefer structured output, the same for every request
+const GENERATION_CONFIG = Object.freeze({
+  temperature: 0.04, // Extremely low temperature for deterministic outputs
+  topP: 0.95,
+  topK: 40,
+});
 
 @Injectable()
 export class GoogleGenaiAdapter {
-  private genAI: GoogleGenAI;
+  private genAI: Promise<GoogleGenAI> | null = null;
+  private readonly apiKey: string;
+  private readonly modelName: string;
   private readonly logger = new Logger(GoogleGenaiAdapter.name);
 
   constructor(private readonly configService: ConfigService) {
@@ -18,7 +41,21 @@ export class GoogleGenaiAdapter {
       throw new Error('Gemini API key is not configured');
     }
 
-    this.genAI = new GoogleGenAI({ apiKey });
+    this.apiKey = apiKey;
+    this.modelName = this.configService.getGeminiModelName() || 'gemini-2.0-flash';
+  }
+
+  /**
+   * Lazily load the Gemini SDK and create the client on first use,
+   * so the SDK is not part of the startup import graph
+   */
+  private getClient(): Promise<GoogleGenAI> {
+    if (!this.genAI) {
+      this.genAI = import('@google/genai').then(
+        ({ GoogleGenAI }) => new GoogleGenAI({ apiKey: this.apiKey }),
+      );
+    }
+    return this.genAI;
   }
 
   async generateContent(
@@ -26,34 +63,27 @@ export class GoogleGenaiAdapter {
     systemInstruction?: string,
     responseMimeType?: string,
     maxOutputTokens?: number,
+    responseSchema?: Record<string, any>,
   ): Promise<GenerativeContentResponse | null> {
     try {
-      const config: any = {};
-
-      if (maxOutputTokens) {
-        config.maxOutputTokens = maxOutputTokens;
-      } else {
-        // Default to a reasonable token limit
-        config.maxOutputTokens = 1000000;
-      }
-
-      // Always set response format to JSON
-      config.responseMimeType = 'application/json';
-
-      // Set generation config to prefer structured output
-      config.generationConfig = {
-        temperature: 0.04, // Extremely low temperature for deterministic outputs
-        topP: 0.95,
-        topK: 40,
+      const config: any = {
+        maxOutputTokens: maxOutputTokens || DEFAULT_MAX_OUTPUT_TOKENS,
+        // Always set response format to JSON
+        responseMimeType: 'application/json',
+        generationConfig: GENERATION_CONFIG,
+        systemInstruction,
       };
 
-      config.systemInstruction = systemInstruction;
-
-      const modelName = this.configService.getGeminiModelName() || 'gemini-2.0-flash';
+      // With a schema Gemini constrains the output to it; the text still goes through the
+      // tolerant extraction below in case a model wraps or prefixes the array
+      if (responseSchema) {
+        config.responseSchema = responseSchema;
+      }
 
-      this.logger.debug(`Calling Gemini model: ${modelName}`);
-      const response = await this.genAI.models.generateContent({
-        model: modelName,
+      this.logger.debug(`Calling Gemini model: ${this.modelName}`);
+      const genAI = await this.getClient();
+      const response = await genAI.models.generateContent({
+        model: this.modelName,
         contents,
         config,
       });
@@ -187,42 +217,11 @@ export class GoogleGenaiAdapter {
     ]);
   }
 
-  generateContentSync(
-    contents: any[],
-    systemInstruction?: string,
-    responseMimeType?: string,
-    maxOutputTokens?: number,
-  ): GenerativeContentResponse | null {
-    // In Node.js environment, we can't truly do sync API calls
-    // This is a wrapper that executes the async call and returns the result or null
-    try {
-      // Execute the promise and wait for the result
-      let result: GenerativeContentResponse | null = null;
-
-      // Start the async operation
-      this.generateContent(contents, systemInstruction, responseMimeType, maxOutputTokens)
-        .then((response) => {
-          result = response;
-        })
-        .catch((error) => {
-          this.logger.error('Error in sync content generation:', error);
-        });
-
-      // Return a placeholder while the async operation completes
-      return {
-        text: 'Processing request...',
-        parts: [],
-      };
-    } catch (error) {
-      this.logger.error('Error in sync wrapper:', error);
-      return null;
-    }
-  }
-
-  uploadFile(filePath: string): GenerativeFile | null {
+  async uploadFile(filePath: string): Promise<GenerativeFile | null> {
     try {
-      const fileData = fs.readFileSync(filePath);
-      const fileName = filePath.split('/').pop() || 'unknown';
+      // Read without blocking the event loop, voice notes can be several megabytes
+      const fileData = await fs.readFile(filePath);
+      const fileName = path.basename(filePath) || 'unknown';
 
       return {
         name: fileName,
@@ -244,17 +243,17 @@ export class GoogleGenaiAdapter {
     try {
       // Upload the audio file to Gemini
       const mimeType = this.getMimeType(audioFilePath);
-      const myfile = await this.genAI.files.upload({
+      const { createUserContent, createPartFromUri } = await import('@google/genai');
+      const genAI = await this.getClient();
+      const myfile = await genAI.files.upload({
         file: String(audioFilePath),
         config: { mimeType },
       });
       // Prepare the prompt for transcription
       const prompt = 'Generate a transcript of the speech.';
-      // Ensure model name is always a string
-      const modelName = this.configService.getGeminiModelName() || 'gemini-2.0-flash';
       // Send the file and prompt to Gemini
-      const response = await this.genAI.models.generateContent({
-        model: modelName,
+      const response = await genAI.models.generateContent({
+        model: this.modelName,
         contents: createUserContent([createPartFromUri(myfile.uri!, myfile.mimeType!), prompt]),
       });
       return response.text || null;
@@ -268,12 +267,6 @@ export class GoogleGenaiAdapter {
    * Get the MIME type for a given audio file path
    */
   private getMimeType(filePath: string): string {
-    if (filePath.endsWith('.mp3')) return 'audio/mp3';
-    if (filePath.endsWith('.wav')) return 'audio/wav';
-    if (filePath.endsWith('.ogg')) return 'audio/ogg';
-    if (filePath.endsWith('.aac')) return 'audio/aac';
-    if (filePath.endsWith('.flac')) return 'audio/flac';
-    if (filePath.endsWith('.aiff')) return 'audio/aiff';
-    return 'application/octet-stream';
+    return AUDIO_MIME_TYPES.get(path.extname(filePath)) ?? 'application/octet-stream';
   }
 }
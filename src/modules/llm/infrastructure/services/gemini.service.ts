@@ -24,21 +24,7 @@ export class GeminiService implements ILLMService {
     );
   }
 
-  callSync(
-    contents: any[],
-    systemInstruction?: string,
-    responseMimeType?: string,
-    maxOutputTokens?: number,
-  ): GenerativeContentResponse | null {
-    return this.genaiAdapter.generateContentSync(
-      contents,
-      systemInstruction,
-      responseMimeType,
-      maxOutputTokens,
-    );
-  }
-
-  uploadFile(filePath: string): GenerativeFile | null {
+  async uploadFile(filePath: string): Promise<GenerativeFile | null> {
     return this.genaiAdapter.uploadFile(filePath);
   }
 
@@ -46,18 +32,6 @@ export class GeminiService implements ILLMService {
     return this.genaiAdapter.deleteFile(fileName);
   }
 
-  transcribeAudio(audioFilePath: string): string | null {
-    // Since we can't do a true sync operation in Node.js for this,
-    // we'll execute the async method and return a placeholder
-    // In a real app, you'd handle this differently
-    this.genaiAdapter
-      .transcribeAudio(audioFilePath)
-      .then((result) => console.log('Transcription completed:', result ? 'success' : 'failed'))
-      .catch((error) => console.error('Transcription error:', error));
-
-    return 'Transcription in progress...';
-  }
-
   /**
    * Transcribe audio file using Gemini (Google GenAI)
    * @param audioFilePath Path to the audio file
@@ -1,5 +1,4 @@
 import { Module, forwardRef } from '@nestjs/common';
-import { ConfigModule } from '@nestjs/config';
 import { LlmProcessorService } from './application/services/llm-processor.service';
 import { ToolsModule } from '../tools/tools.module';
 import { GoogleGenaiAdapter } from './infrastructure/adapters/google-genai.adapter';
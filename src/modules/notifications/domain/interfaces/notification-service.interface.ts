@@ -30,9 +30,10 @@ export interface INotificationService {
    * Schedule reminders for a task
    *
    * @param task - The task to schedule reminders for
+   * @param now - Reference time for skipping past reminders (defaults to the current time)
    * @returns Promise resolving to void
    */
-  scheduleRemindersForTask(task: Task): Promise<void>;
+  scheduleRemindersForTask(task: Task, now?: Date): Promise<void>;
 
   /**
    * Reset and reschedule all reminders for today's tasks
@@ -12,6 +12,16 @@ export interface ISchedulingService {
    */
   addJob(cronExpression: string, jobId: string, callback: () => void): void;
 
+  /**
+   * Run a job once at the given moment, however far in the future
+   *
+   * @param runAt - When the job should run
+   * @param jobId - Unique identifier for the job
+   * @param callback - Function to execute when the job runs
+   * @returns void
+   */
+  addOneTimeJob(runAt: Date, jobId: string, callback: () => void): void;
+
   /**
    * Remove a job from the schedule
    *
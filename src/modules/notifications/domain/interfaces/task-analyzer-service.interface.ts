@@ -1,5 +1,12 @@
 import { Task } from '../models/task.model';
 
+export interface TaskDayOverview {
+  todaysTasks: Task[];
+  overdueTasks: Task[];
+  completedTasksToday: Task[];
+  uncompletedTasksToday: Task[];
+}
+
 export interface ITaskAnalyzerService {
   /**
    * Get all tasks scheduled for today
@@ -36,4 +43,19 @@ export interface ITaskAnalyzerService {
    * @returns Promise resolving to an array of tasks for the specified date
    */
   getTasksForDate(date: Date): Promise<Task[]>;
+
+  /**
+   * Get today's, overdue and completed-today tasks from a single read of the vault
+   *
+   * @param date - The day to build the overview for (defaults to now)
+   * @returns Promise resolving to the tasks grouped for that day
+   */
+  getDayOverview(date?: Date): Promise<TaskDayOverview>;
+
+  /**
+   * Update cached task data for a single changed file
+   *
+   * @param relativePath - Path of the changed file relative to the vault root
+   */
+  refreshTaskFile(relativePath: string): Promise<void>;
 }
@@ -2,7 +2,7 @@ import {
   Inject,
   Injectable,
   Logger,
-  OnModuleInit,
+  OnApplicationBootstrap,
   OnModuleDestroy,
   forwardRef,
 } from '@nestjs/common';
@@ -11,7 +11,7 @@ import { INotificationService } from '../../domain/interfaces/notification-servi
 import { ITaskAnalyzerService } from '../../domain/interfaces/task-analyzer-service.interface';
 import { ISchedulingService } from '../../domain/interfaces/scheduling-service.interface';
 import { ConfigService } from '../../../../shared/infrastructure/config/config.service';
-import { Task, TaskStatus } from '../../domain/models/task.model';
+import { Task, TaskPriority, TaskStatus } from '../../domain/models/task.model';
 import { GoogleGenaiAdapter } from '../../../llm/infrastructure/adapters/google-genai.adapter';
 import { HistoryService } from '../../../../shared/infrastructure/persistence/history.service';
 import { PromptBuilderService } from '../../../../shared/infrastructure/services/prompt-builder.service';
@@ -23,15 +23,122 @@ import { VaultService } from '../../../vault/infrastructure/services/vault.servi
 import { ProcessMessageService } from '../../../telegram/application/services/process-message.service';
 import { LlmResponse } from '../../../llm/application/services/llm-processor.service';
 import { CronExpression } from '@nestjs/schedule';
+import * as path from 'path';
+import { createHash, randomUUID } from 'crypto';
+
+const MS_PER_MINUTE = 60 * 1000;
+const MS_PER_DAY = 24 * 60 * MS_PER_MINUTE;
+// Reminder lead time for tasks that don't define their own reminders
+const DEFAULT_REMINDER_MINUTES = 15;
+// Most overdue tasks listed in a morning digest; the rest are only counted
+const MAX_DIGEST_OVERDUE_TASKS = 20;
+// Conversation entries given to the LLM as context for a notification
+const RECENT_HISTORY_LIMIT = 5;
+// Longest text kept per history entry in notification prompts
+const MAX_HISTORY_ENTRY_LENGTH = 400;
+
+type LlmResponseKind = 'task-reminder' | 'morning-digest' | 'evening-check-in';
+
+// How long a generated notification is reused for identical inputs. The task data is part
+// of the cache key, so the TTL only bounds how stale the conversation context may get:
+// a digest is pinned to its day's tasks, while a check-in already carries recent history.
+const LLM_RESPONSE_TTL_MS: Record<LlmResponseKind, number> = {
+  'task-reminder': 10 * MS_PER_MINUTE,
+  'morning-digest': 60 * MS_PER_MINUTE,
+  'evening-check-in': 5 * MS_PER_MINUTE,
+};
+const MAX_CACHED_LLM_RESPONSES = 256;
+
+// Calendar names used when formatting dates and fallback messages
+const SHORT_MONTH_NAMES = [
+  'Jan',
+  'Feb',
+  'Mar',
+  'Apr',
+  'May',
+  'Jun',
+  'Jul',
+  'Aug',
+  'Sep',
+  'Oct',
+  'Nov',
+  'Dec',
+] as const;
+const DAY_NAMES = [
+  'Sunday',
+  'Monday',
+  'Tuesday',
+  'Wednesday',
+  'Thursday',
+  'Friday',
+  'Saturday',
+] as const;
+const MONTH_NAMES = [
+  'January',
+  'February',
+  'March',
+  'April',
+  'May',
+  'June',
+  'July',
+  'August',
+  'September',
+  'October',
+  'November',
+  'December',
+] as const;
+const RU_DAY_NAMES = [
+  'Воскресенье',
+  'Понедельник',
+  'Вторник',
+  'Среда',
+  'Четверг',
+  'Пятница',
+  'Суббота',
+] as const;
+const RU_MONTH_NAMES = [
+  'Января',
+  'Февраля',
+  'Марта',
+  'Апреля',
+  'Мая',
+  'Июня',
+  'Июля',
+  'Августа',
+  'Сентября',
+  'Октября',
+  'Ноября',
+  'Декабря',
+] as const;
+
+// Plain snapshot of a task as passed to the LLM and the fallback message builders
+interface TaskSummary {
+  title: string;
+  date: string;
+  startTime?: string;
+  completed: boolean;
+  priority?: TaskPriority;
+  status: TaskStatus;
+}
 
 @Injectable()
-export class NotificationService implements INotificationService, OnModuleInit, OnModuleDestroy {
+export class NotificationService
+  implements INotificationService, OnApplicationBootstrap, OnModuleDestroy
+{
   private readonly logger = new Logger(NotificationService.name);
   private readonly userLanguage: string = 'ru'; // Default to Russian, could be made configurable
-  private activeReminders: Map<string, { taskId: string; scheduledTime: Date }> = new Map();
+  // Task file per scheduled reminder ID; that is all untracking needs
+  private activeReminders: Map<string, string> = new Map();
+  // Reminder IDs per task file, kept in sync with activeReminders for O(1) lookups
+  private remindersByFile: Map<string, Set<string>> = new Map();
   private dailyResetJob: schedule.Job | null = null;
   private morningDigestJob: schedule.Job | null = null;
   private eveningCheckInJob: schedule.Job | null = null;
+  // Content-hash keyed LLM responses; the promise is stored so concurrent requests share one call
+  private llmResponseCache: Map<string, { expiresAt: number; response: Promise<LlmResponse> }> =
+    new Map();
+  private llmCacheHits = 0;
+  private llmCacheMisses = 0;
 
   constructor(
     readonly taskAnalyzer: TaskAnalyzerService,
@@ -43,6 +150,7 @@ export class NotificationService implements INotificationService, OnModuleInit,
     @Inject(forwardRef(() => SendMessageService))
     private readonly sendMessageService: SendMessageService,
     private readonly vaultService: VaultService,
+    @Inject(forwardRef(() => ProcessMessageService))
     private readonly processMessageService: ProcessMessageService,
   ) {
     // Subscribe to file change events
@@ -52,7 +160,11 @@ export class NotificationService implements INotificationService, OnModuleInit,
     });
   }
 
-  async onModuleInit() {
+  /**
+   * Cron jobs and the initial reminder scan are started only once the whole
+   * application has bootstrapped, so merely resolving this provider stays cheap
+   */
+  onApplicationBootstrap() {
     this.logger.log('Notification service initialized');
 
     // Set up daily reset cron job using node-schedule
@@ -76,8 +188,8 @@ export class NotificationService implements INotificationService, OnModuleInit,
 
     this.logger.log('Evening check-in cron job scheduled for 8:00 PM daily');
 
-    // Schedule initial tasks
-    await this.resetAndRescheduleAllReminders();
+    // Schedule initial tasks in the background; this reads the whole tasks folder
+    void this.resetAndRescheduleAllReminders();
   }
 
   async handleDailyReset() {
@@ -85,41 +197,38 @@ export class NotificationService implements INotificationService, OnModuleInit,
     await this.resetAndRescheduleAllReminders();
 
     // Send a system notification about the reset
-    const userIds = this.configService.getTelegramUserIds();
-    for (const userId of userIds) {
-      try {
-        const numericUserId = parseInt(userId, 10);
-        if (!isNaN(numericUserId)) {
+    const userIds = this.configService.getTelegramUserIdNumbers();
+    await Promise.all(
+      userIds.map(async (userId) => {
+        try {
           await this.sendMessageService.sendMessage(
-            numericUserId,
+            userId,
             '🔄 *System Notification*\nDaily notification reset completed. All reminders for today have been rescheduled.',
             'Markdown',
           );
+        } catch (error) {
+          this.logger.error(`Error sending daily reset notification to user ${userId}:`, error);
         }
-      } catch (error) {
-        this.logger.error(`Error sending daily reset notification to user ${userId}:`, error);
-      }
-    }
+      }),
+    );
   }
 
   async handleMorningDigest() {
     this.logger.log('Performing morning digest broadcast at 8:00 AM');
 
-    const userIds = this.configService.getTelegramUserIds();
-    const results = [];
-
-    for (const userId of userIds) {
-      try {
-        const numericUserId = parseInt(userId, 10);
-        if (!isNaN(numericUserId)) {
-          const result = await this.sendMorningDigest(numericUserId);
-          results.push({ userId: numericUserId, success: result });
+    const userIds = this.configService.getTelegramUserIdNumbers();
+    // Each user gets a single message, so the LLM calls can run side by side
+    const results = await Promise.all(
+      userIds.map(async (userId) => {
+        try {
+          const result = await this.sendMorningDigest(userId);
+          return { userId, success: result };
+        } catch (error) {
+          this.logger.error(`Error sending morning digest to user ${userId}:`, error);
+          return { userId, success: false, error: error.message };
         }
-      } catch (error) {
-        this.logger.error(`Error sending morning digest to user ${userId}:`, error);
-        results.push({ userId, success: false, error: error.message });
-      }
-    }
+      }),
+    );
 
     const successCount = results.filter((r) => r.success).length;
     this.logger.log(`Morning digest sent to ${successCount}/${userIds.length} users`);
@@ -128,21 +237,18 @@ export class NotificationService implements INotificationService, OnModuleInit,
   async handleEveningCheckIn() {
     this.logger.log('Performing evening check-in broadcast at 8:00 PM');
 
-    const userIds = this.configService.getTelegramUserIds();
-    const results = [];
-
-    for (const userId of userIds) {
-      try {
-        const numericUserId = parseInt(userId, 10);
-        if (!isNaN(numericUserId)) {
-          const result = await this.sendEveningCheckIn(numericUserId);
-          results.push({ userId: numericUserId, success: result });
+    const userIds = this.configService.getTelegramUserIdNumbers();
+    const results = await Promise.all(
+      userIds.map(async (userId) => {
+        try {
+          const result = await this.sendEveningCheckIn(userId);
+          return { userId, success: result };
+        } catch (error) {
+          this.logger.error(`Error sending evening check-in to user ${userId}:`, error);
+          return { userId, success: false, error: error.message };
         }
-      } catch (error) {
-        this.logger.error(`Error sending evening check-in to user ${userId}:`, error);
-        results.push({ userId, success: false, error: error.message });
-      }
-    }
+      }),
+    );
 
     const successCount = results.filter((r) => r.success).length;
     this.logger.log(`Evening check-in sent to ${successCount}/${userIds.length} users`);
@@ -159,15 +265,25 @@ export class NotificationService implements INotificationService, OnModuleInit,
 
       // Reset the active reminders map
       this.activeReminders.clear();
+      this.remindersByFile.clear();
 
-      // Get today's tasks and schedule reminders for them
-      const todaysTasks = await this.taskAnalyzer.getTodaysTasks();
+      // Get today's tasks and schedule reminders for them against a single clock reading
+      const now = new Date();
+      const { todaysTasks, uncompletedTasksToday } = await this.taskAnalyzer.getDayOverview(now);
       this.logger.log(`Found ${todaysTasks.length} tasks for today, scheduling reminders`);
 
-      for (const task of todaysTasks) {
-        if (!task.isCompleted()) {
-          await this.scheduleRemindersForTask(task);
-        }
+      // Completed tasks are already filtered out by the overview; tasks whose last
+      // reminder has already passed would only log skips, so drop them up front
+      const pendingTasks = uncompletedTasksToday.filter((task) =>
+        this.hasUpcomingReminder(task, now),
+      );
+      const skipped = uncompletedTasksToday.length - pendingTasks.length;
+      if (skipped > 0) {
+        this.logger.debug(`Skipping ${skipped} tasks with no upcoming reminders`);
+      }
+
+      for (const task of pendingTasks) {
+        await this.scheduleRemindersForTask(task, now);
       }
 
       this.logger.log(`Successfully rescheduled ${this.activeReminders.size} reminders`);
@@ -183,8 +299,7 @@ export class NotificationService implements INotificationService, OnModuleInit,
       );
 
       // Get user IDs from config
-      const userIds = this.configService.getTelegramUserIds();
-      let success = true;
+      const userIds = this.configService.getTelegramUserIdNumbers();
 
       // Format task date and time for display
       const taskDate = task.getDate();
@@ -208,31 +323,34 @@ export class NotificationService implements INotificationService, OnModuleInit,
         minutesBefore: minutesBefore,
       };
 
-      this.logger.debug(`Task data for LLM: ${JSON.stringify(taskData)}`);
+      // Serialized once for the log, the cache key and the LLM request
+      const taskJson = JSON.stringify(taskData);
+      this.logger.debug(`Task data for LLM: ${taskJson}`);
 
       // Generate personalized notification using LLM
-      const llmResponse = await this.generateTaskReminderWithLLM(taskData);
+      const llmResponse = await this.getCachedLlmResponse('task-reminder', taskJson, () =>
+        this.generateTaskReminderWithLLM(taskData, taskJson),
+      );
 
       this.logger.log(`Generated reminder for task "${task.getTitle()}"`);
 
       // Send message to all configured users
-      for (const userId of userIds) {
-        try {
-          const numericUserId = parseInt(userId, 10);
-          if (!isNaN(numericUserId)) {
-            this.logger.debug(`Sending task reminder to user ${numericUserId}`);
+      const results = await Promise.all(
+        userIds.map(async (userId) => {
+          try {
+            this.logger.debug(`Sending task reminder to user ${userId}`);
 
             // Execute the tool calls from the LLM response
-            // Convert numericUserId to string as required by executeToolCalls
-            await this.processMessageService.executeToolCalls(llmResponse, userId.toString());
+            await this.processMessageService.executeToolCalls(llmResponse, userId);
+            return true;
+          } catch (error) {
+            this.logger.error(`Error sending task reminder to user ${userId}:`, error);
+            return false;
           }
-        } catch (error) {
-          this.logger.error(`Error sending task reminder to user ${userId}:`, error);
-          success = false;
-        }
-      }
+        }),
+      );
 
-      return success;
+      return results.every(Boolean);
     } catch (error) {
       this.logger.error(`Error sending task reminder: ${error.message}`, error.stack);
       return false;
@@ -243,40 +361,45 @@ export class NotificationService implements INotificationService, OnModuleInit,
     try {
       this.logger.log(`Preparing morning digest for user ${userId}`);
 
-      // Get today's tasks
-      const todaysTasks = await this.taskAnalyzer.getTodaysTasks();
+      // Get today's and overdue tasks from a single read of the vault
+      const now = new Date();
+      const { todaysTasks, overdueTasks } = await this.taskAnalyzer.getDayOverview(now);
       this.logger.debug(`Found ${todaysTasks.length} tasks for today`);
-
-      // Get overdue tasks
-      const overdueTasks = await this.taskAnalyzer.getOverdueTasks();
       this.logger.debug(`Found ${overdueTasks.length} overdue tasks`);
 
       // Prepare data for LLM
       const digestData = {
-        date: new Date(),
-        todaysTasks: todaysTasks.map((task) => ({
-          title: task.getTitle(),
-          startTime: task.getStartTime(),
-          completed: task.isCompleted(),
-          priority: task.getPriority(),
-          status: task.getStatus(),
-        })),
-        overdueTasks: overdueTasks.map((task) => ({
-          title: task.getTitle(),
-          date: task.getDate() ? this.formatDate(task.getDate()!) : 'No date',
-          priority: task.getPriority(),
-          status: task.getStatus(),
-        })),
+        date: now,
+        todaysTasks: todaysTasks.map((task) => this.toTaskSummary(task)),
+        overdueTasks: this.selectTopOverdueTasks(
+          overdueTasks,
+          MAX_DIGEST_OVERDUE_TASKS,
+          now,
+        ).map((task) => this.toTaskSummary(task)),
+        overdueCount: overdueTasks.length,
       };
 
-      // Generate personalized morning digest using LLM
-      const llmResponse = await this.generateMorningDigestWithLLM(digestData);
+      // With nothing due or overdue the static digest says it all, so skip the LLM call
+      let llmResponse: LlmResponse;
+      if (todaysTasks.length === 0 && overdueTasks.length === 0) {
+        llmResponse = {
+          toolCalls: [
+            { tool: 'reply', params: { message: this.createFallbackMorningDigest(digestData) } },
+          ],
+        };
+      } else {
+        // Generate personalized morning digest using LLM
+        llmResponse = await this.getCachedLlmResponse(
+          'morning-digest',
+          { ...digestData, date: this.formatDate(now) },
+          () => this.generateMorningDigestWithLLM(digestData),
+        );
+      }
 
       this.logger.log(`Generated morning digest for user ${userId}`);
 
       // Execute the tool calls from the LLM response
-      // Convert userId to string as required by executeToolCalls
-      await this.processMessageService.executeToolCalls(llmResponse, userId.toString());
+      await this.processMessageService.executeToolCalls(llmResponse, userId);
 
       return true;
     } catch (error) {
@@ -289,41 +412,35 @@ export class NotificationService implements INotificationService, OnModuleInit,
     try {
       this.logger.log(`Preparing evening check-in for user ${userId}`);
 
-      // Get completed tasks for today
-      const completedTasksToday = await this.taskAnalyzer.getCompletedTasksToday();
+      // Get completed and uncompleted tasks for today from a single read of the vault
+      const now = new Date();
+      const { completedTasksToday, uncompletedTasksToday } =
+        await this.taskAnalyzer.getDayOverview(now);
       this.logger.debug(`Found ${completedTasksToday.length} completed tasks for today`);
-
-      // Get uncompleted tasks for today
-      const todaysTasks = await this.taskAnalyzer.getTodaysTasks();
-      const uncompletedTasksToday = todaysTasks.filter((task) => !task.isCompleted());
       this.logger.debug(`Found ${uncompletedTasksToday.length} uncompleted tasks for today`);
 
       // Get recent history
-      const recentHistory = this.historyService.getHistory().slice(-5);
+      const recentHistory = this.historyService.getRecentHistory(RECENT_HISTORY_LIMIT);
 
       // Prepare data for LLM
       const checkInData = {
-        date: new Date(),
-        completedTasksToday: completedTasksToday.map((task) => ({
-          title: task.getTitle(),
-          priority: task.getPriority(),
-          status: task.getStatus(),
-        })),
-        uncompletedTasksToday: uncompletedTasksToday.map((task) => ({
-          title: task.getTitle(),
-          priority: task.getPriority(),
-          status: task.getStatus(),
-        })),
+        date: now,
+        completedTasksToday: completedTasksToday.map((task) => this.toTaskSummary(task)),
+        uncompletedTasksToday: uncompletedTasksToday.map((task) => this.toTaskSummary(task)),
         recentHistory: this.formatRecentHistory(recentHistory),
       };
 
       // Generate personalized evening check-in using LLM
-      const llmResponse = await this.generateEveningCheckInWithLLM(checkInData);
+      const llmResponse = await this.getCachedLlmResponse(
+        'evening-check-in',
+        { ...checkInData, date: this.formatDate(now) },
+        () => this.generateEveningCheckInWithLLM(checkInData),
+      );
 
       this.logger.log(`Generated evening check-in for user ${userId}`);
 
       // Execute the tool calls from the LLM response
-      await this.processMessageService.executeToolCalls(llmResponse, userId.toString());
+      await this.processMessageService.executeToolCalls(llmResponse, userId);
 
       return true;
     } catch (error) {
@@ -332,15 +449,15 @@ export class NotificationService implements INotificationService, OnModuleInit,
     }
   }
 
-  async scheduleRemindersForTask(task: Task): Promise<void> {
+  async scheduleRemindersForTask(task: Task, now: Date = new Date()): Promise<void> {
     try {
       this.logger.log(`Scheduling reminders for task "${task.getTitle()}"`);
 
-      const taskDate = task.getDate();
-      const startTime = task.getStartTime();
+      // The start time is the same for every reminder of the task, so resolve it once
+      const startTime = this.getTaskStartTime(task);
 
       // Skip if task has no date or is already completed
-      if (!taskDate || task.isCompleted()) {
+      if (startTime === null || task.isCompleted()) {
         this.logger.debug(
           `Skipping reminder scheduling for task "${task.getTitle()}" - no date or already completed`,
         );
@@ -350,60 +467,45 @@ export class NotificationService implements INotificationService, OnModuleInit,
       // Get reminders configuration
       const reminders = task.getReminders();
 
+      // Replace whatever was scheduled for this task file before
+      this.clearRemindersForFile(task.getFilePath());
+
       // If task has explicit reminders defined, schedule them
-      if (reminders && reminders.length > 0) {
+      if (reminders.length > 0) {
         this.logger.debug(`Task has ${reminders.length} custom reminders defined`);
         for (const reminder of reminders) {
-          if (this.activeReminders.has(task.getId())) {
-            this.activeReminders.delete(task.getId());
-          }
-          this.scheduleTaskReminder(task, reminder.minutesBefore);
+          this.scheduleTaskReminder(task, startTime, reminder.minutesBefore, now);
         }
       } else {
         // Default reminder: 15 minutes before task
         this.logger.debug(`No custom reminders defined, using default 15 minute reminder`);
-        if (!this.activeReminders.has(task.getId())) {
-          this.scheduleTaskReminder(task, 15);
-        }
+        this.scheduleTaskReminder(task, startTime, DEFAULT_REMINDER_MINUTES, now);
       }
     } catch (error) {
       this.logger.error(`Error scheduling reminders for task: ${error.message}`, error.stack);
     }
   }
 
-  private scheduleTaskReminder(task: Task, minutesBefore: number): void {
+  private scheduleTaskReminder(
+    task: Task,
+    startTime: number,
+    minutesBefore: number,
+    now: Date,
+  ): void {
     try {
-      const taskDate = task.getDate();
-      const startTime = task.getStartTime();
-
-      if (!taskDate) {
-        return;
-      }
-
-      // Create a date object for the reminder time
-      const reminderDate = new Date(taskDate);
-
-      // If task has a specific start time, use it
-      if (startTime) {
-        const [hours, minutes] = startTime.split(':').map(Number);
-        reminderDate.setHours(hours, minutes, 0, 0);
-      } else {
-        // Default to 9:00 AM for all-day tasks
-        reminderDate.setHours(9, 0, 0, 0);
-      }
-
-      // Subtract the reminder time
-      reminderDate.setMinutes(reminderDate.getMinutes() - minutesBefore);
+      // Subtract the reminder offset in epoch milliseconds
+      const reminderTime = startTime - minutesBefore * MS_PER_MINUTE;
 
       // Skip if reminder time is in the past
-      if (reminderDate <= new Date()) {
+      if (reminderTime <= now.getTime()) {
         this.logger.debug(
           `Skipping reminder for task "${task.getTitle()}" - reminder time is in the past`,
         );
         return;
       }
+      const reminderDate = new Date(reminderTime);
 
-      // Format the date and time for the schedule
+      // Format the date and time for the log message
       const scheduleTime = this.formatTime(reminderDate);
       const scheduleDate = this.formatDate(reminderDate);
 
@@ -411,16 +513,13 @@ export class NotificationService implements INotificationService, OnModuleInit,
       const reminderId = `task_reminder_${this.generateId()}`;
 
       // Store in active reminders map
-      this.activeReminders.set(reminderId, {
-        taskId: task.getId(),
-        scheduledTime: reminderDate,
-      });
+      this.trackReminder(reminderId, task.getFilePath());
 
       // Schedule the reminder using our scheduling service
-      this.schedulingService.addJob(`daily at ${scheduleTime}`, reminderId, () => {
+      this.schedulingService.addOneTimeJob(reminderDate, reminderId, () => {
         this.sendTaskReminder(task, minutesBefore);
         // Remove from active reminders after it's triggered
-        this.activeReminders.delete(reminderId);
+        this.untrackReminder(reminderId);
       });
 
       this.logger.log(
@@ -431,6 +530,174 @@ export class NotificationService implements INotificationService, OnModuleInit,
     }
   }
 
+  /**
+   * Epoch milliseconds at which a task starts: its start time, or 9:00 AM for all-day tasks
+   */
+  private getTaskStartTime(task: Task): number | null {
+    const taskDate = task.getDate();
+    if (!taskDate) {
+      return null;
+    }
+
+    const startDate = new Date(taskDate);
+    const startTime = task.getStartTime();
+    if (startTime) {
+      const [hours, minutes] = startTime.split(':').map(Number);
+      startDate.setHours(hours, minutes, 0, 0);
+    } else {
+      startDate.setHours(9, 0, 0, 0);
+    }
+    return startDate.getTime();
+  }
+
+  /**
+   * Whether the latest of a task's reminders is still ahead of `now`
+   */
+  private hasUpcomingReminder(task: Task, now: Date): boolean {
+    const startTime = this.getTaskStartTime(task);
+    if (startTime === null) {
+      return false;
+    }
+
+    const reminders = task.getReminders();
+    const smallestOffset =
+      reminders.length > 0
+        ? Math.min(...reminders.map((reminder) => reminder.minutesBefore))
+        : DEFAULT_REMINDER_MINUTES;
+    return startTime - smallestOffset * MS_PER_MINUTE > now.getTime();
+  }
+
+  /**
+   * Pick the most important overdue tasks without sorting the whole list. Each task gets
+   * one score, priority weight times recency, so a high-priority task that slipped yesterday
+   * outranks a stale low-priority one; a bounded insertion keeps only the top `limit`.
+   * Short lists are ranked too, so the digest order does not change with the task count.
+   */
+  private selectTopOverdueTasks(tasks: Task[], limit: number, now: Date): Task[] {
+    // Scores are computed once per task, not on every comparison. A NaN score would break
+    // the binary search, so a priority or date that is not a number counts as the lowest
+    const nowTime = now.getTime();
+    const scores = tasks.map((task) => {
+      const rawPriority = task.getPriority();
+      const priority = Number.isFinite(rawPriority) ? rawPriority! : TaskPriority.LOWEST + 1;
+      const daysOverdue = (nowTime - (task.getDate()?.getTime() ?? 0)) / MS_PER_DAY;
+      const score = 2 ** (TaskPriority.LOWEST - priority) / (1 + Math.max(daysOverdue, 0));
+      return Number.isFinite(score) ? score : 0;
+    });
+
+    const top: number[] = [];
+    for (let i = 0; i < tasks.length; i++) {
+      if (top.length === limit && scores[i] <= scores[top[limit - 1]]) continue;
+
+      let low = 0;
+      let high = top.length;
+      while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (scores[top[mid]] >= scores[i]) {
+          low = mid + 1;
+        } else {
+          high = mid;
+        }
+      }
+      top.splice(low, 0, i);
+      if (top.length > limit) top.pop();
+    }
+    return top.map((i) => tasks[i]);
+  }
+
+  /**
+   * Return the LLM response for an identical request made within the TTL, or generate it.
+   * The key hashes the kind and payload (used as is when already serialized);
+   * responses that fell back after an error or rejected are not kept.
+   */
+  private getCachedLlmResponse(
+    kind: LlmResponseKind,
+    payload: unknown,
+    generate: () => Promise<LlmResponse>,
+  ): Promise<LlmResponse> {
+    const serialized = typeof payload === 'string' ? payload : JSON.stringify(payload);
+    const key = createHash('sha256').update(kind).update(serialized).digest('hex');
+    const now = Date.now();
+
+    const cached = this.llmResponseCache.get(key);
+    if (cached && cached.expiresAt > now) {
+      this.llmCacheHits++;
+      this.logger.debug(
+        `LLM cache hit for ${kind} (hits: ${this.llmCacheHits}, misses: ${this.llmCacheMisses})`,
+      );
+      return cached.response;
+    }
+    this.llmCacheMisses++;
+
+    for (const [cachedKey, entry] of this.llmResponseCache) {
+      if (entry.expiresAt <= now || this.llmResponseCache.size >= MAX_CACHED_LLM_RESPONSES) {
+        this.llmResponseCache.delete(cachedKey);
+      }
+    }
+
+    const response = generate();
+    const entry = { expiresAt: now + LLM_RESPONSE_TTL_MS[kind], response };
+    this.llmResponseCache.set(key, entry);
+    const evict = () => {
+      if (this.llmResponseCache.get(key) === entry) {
+        this.llmResponseCache.delete(key);
+      }
+    };
+    // The caller handles a rejection; this only keeps it out of the cache
+    void response.then((result) => {
+      if (result.error) {
+        evict();
+      }
+    }, evict);
+    return response;
+  }
+
+  private toTaskSummary(task: Task): TaskSummary {
+    const date = task.getDate();
+    return {
+      title: task.getTitle(),
+      date: date ? this.formatDate(date) : 'No date',
+      startTime: task.getStartTime(),
+      completed: task.isCompleted(),
+      priority: task.getPriority(),
+      status: task.getStatus(),
+    };
+  }
+
+  private trackReminder(reminderId: string, filePath: string): void {
+    this.activeReminders.set(reminderId, filePath);
+
+    let fileReminders = this.remindersByFile.get(filePath);
+    if (!fileReminders) {
+      fileReminders = new Set();
+      this.remindersByFile.set(filePath, fileReminders);
+    }
+    fileReminders.add(reminderId);
+  }
+
+  private untrackReminder(reminderId: string): void {
+    const filePath = this.activeReminders.get(reminderId);
+    if (filePath === undefined) return;
+
+    this.activeReminders.delete(reminderId);
+    const fileReminders = this.remindersByFile.get(filePath);
+    fileReminders?.delete(reminderId);
+    if (fileReminders?.size === 0) {
+      this.remindersByFile.delete(filePath);
+    }
+  }
+
+  private clearRemindersForFile(filePath: string): void {
+    const fileReminders = this.remindersByFile.get(filePath);
+    if (!fileReminders) return;
+
+    for (const reminderId of fileReminders) {
+      this.schedulingService.unschedule(reminderId);
+      this.activeReminders.delete(reminderId);
+    }
+    this.remindersByFile.delete(filePath);
+  }
+
   // Helper methods to replace date-fns
   private formatDate(date: Date): string {
     return `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
@@ -441,37 +708,22 @@ export class NotificationService implements INotificationService, OnModuleInit,
   }
 
   private formatShortDate(date: Date): string {
-    const monthNames = [
-      'Jan',
-      'Feb',
-      'Mar',
-      'Apr',
-      'May',
-      'Jun',
-      'Jul',
-      'Aug',
-      'Sep',
-      'Oct',
-      'Nov',
-      'Dec',
-    ];
-    return `${monthNames[date.getMonth()]} ${date.getDate()}`;
+    return `${SHORT_MONTH_NAMES[date.getMonth()]} ${date.getDate()}`;
   }
 
-  // Simple UUID generator to replace uuid
+  // Reminder IDs only need to be unique, so use the built-in generator
   private generateId(): string {
-    return 'xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'.replace(/[xy]/g, function (c) {
-      const r = (Math.random() * 16) | 0;
-      const v = c === 'x' ? r : (r & 0x3) | 0x8;
-      return v.toString(16);
-    });
+    return randomUUID();
   }
 
   // LLM-based notification generators
-  private async generateTaskReminderWithLLM(taskData: any): Promise<LlmResponse> {
+  private async generateTaskReminderWithLLM(
+    taskData: any,
+    taskJson: string = JSON.stringify(taskData),
+  ): Promise<LlmResponse> {
     try {
       // Get recent conversation history
-      const history = this.historyService.getHistory();
+      const history = this.historyService.getRecentHistory(RECENT_HISTORY_LIMIT);
       const formattedHistory = this.formatRecentHistory(history);
 
       const systemInstruction = `You are an AI assistant tasked with creating personalized task reminders.
@@ -506,7 +758,7 @@ Do not include any text outside the JSON structure. Ensure your message is conci
 
       this.logger.debug('Calling LLM to generate task reminder');
       const response = await this.llmAdapter.generateContent(
-        [{ text: JSON.stringify(taskData) }],
+        [{ text: taskJson }],
         systemInstruction,
         'text/plain',
       );
@@ -593,7 +845,7 @@ Do not include any text outside the JSON structure. Ensure your message is conci
   private async generateMorningDigestWithLLM(digestData: any): Promise<LlmResponse> {
     try {
       // Get recent conversation history
-      const history = this.historyService.getHistory();
+      const history = this.historyService.getRecentHistory(RECENT_HISTORY_LIMIT);
       const formattedHistory = this.formatRecentHistory(history);
 
       const systemInstruction = `You are an AI assistant tasked with creating personalized morning digests.
@@ -602,6 +854,7 @@ TASK:
 Create a concise, friendly morning digest that summarizes the day's tasks and any overdue items.
 Include emoji, format with Markdown, and maintain a motivational tone.
 Include the date, list of today's tasks with their status, and any overdue tasks.
+"overdueTasks" holds only the top ${MAX_DIGEST_OVERDUE_TASKS} overdue tasks by priority; "overdueCount" is the total number of overdue tasks, so report that number when mentioning how many are overdue.
 End with a brief motivational message. Keep the digest under 300 words.
 
 IMPORTANT: Use ${this.userLanguage} language for your response.
@@ -703,56 +956,16 @@ Do not include any text outside the JSON structure. Ensure your message is conci
   }
 
   private createFallbackMorningDigest(digestData: any): string {
-    const today = new Date();
-    const dayNames = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
-    const monthNames = [
-      'January',
-      'February',
-      'March',
-      'April',
-      'May',
-      'June',
-      'July',
-      'August',
-      'September',
-      'October',
-      'November',
-      'December',
-    ];
-
-    // Russian day and month names
-    const ruDayNames = [
-      'Воскресенье',
-      'Понедельник',
-      'Вторник',
-      'Среда',
-      'Четверг',
-      'Пятница',
-      'Суббота',
-    ];
-    const ruMonthNames = [
-      'Января',
-      'Февраля',
-      'Марта',
-      'Апреля',
-      'Мая',
-      'Июня',
-      'Июля',
-      'Августа',
-      'Сентября',
-      'Октября',
-      'Ноября',
-      'Декабря',
-    ];
+    const today: Date = digestData.date;
 
     let message = '';
     if (this.userLanguage === 'ru') {
-      message = `🌞 *Доброе утро!* Вот ваши задачи на ${ruDayNames[today.getDay()]}, ${today.getDate()} ${ruMonthNames[today.getMonth()]}:\n\n`;
+      message = `🌞 *Доброе утро!* Вот ваши задачи на ${RU_DAY_NAMES[today.getDay()]}, ${today.getDate()} ${RU_MONTH_NAMES[today.getMonth()]}:\n\n`;
 
       // Add today's tasks section
       message += `*Задачи на сегодня (${digestData.todaysTasks.length}):*\n`;
       if (digestData.todaysTasks.length > 0) {
-        digestData.todaysTasks.forEach((task: any, index: number) => {
+        digestData.todaysTasks.forEach((task: TaskSummary, index: number) => {
           const startTime = task.startTime ? ` в ${task.startTime}` : '';
           message += `${index + 1}. ${task.completed ? '✅' : '⬜'} ${task.title}${startTime}\n`;
         });
@@ -762,8 +975,8 @@ Do not include any text outside the JSON structure. Ensure your message is conci
 
       // Add overdue tasks section if any
       if (digestData.overdueTasks.length > 0) {
-        message += `\n*Просроченные задачи (${digestData.overdueTasks.length}):*\n`;
-        digestData.overdueTasks.forEach((task: any, index: number) => {
+        message += `\n*Просроченные задачи (${digestData.overdueCount}):*\n`;
+        digestData.overdueTasks.forEach((task: TaskSummary, index: number) => {
           message += `${index + 1}. ⚠️ ${task.title} (срок: ${task.date})\n`;
         });
       }
@@ -772,12 +985,12 @@ Do not include any text outside the JSON structure. Ensure your message is conci
       message += '\nЖелаю продуктивного дня! 💪';
     } else {
       // English fallback
-      message = `🌞 *Good morning!* Here's your task digest for ${dayNames[today.getDay()]}, ${monthNames[today.getMonth()]} ${today.getDate()}:\n\n`;
+      message = `🌞 *Good morning!* Here's your task digest for ${DAY_NAMES[today.getDay()]}, ${MONTH_NAMES[today.getMonth()]} ${today.getDate()}:\n\n`;
 
       // Add today's tasks section
       message += `*Today's Tasks (${digestData.todaysTasks.length}):*\n`;
       if (digestData.todaysTasks.length > 0) {
-        digestData.todaysTasks.forEach((task: any, index: number) => {
+        digestData.todaysTasks.forEach((task: TaskSummary, index: number) => {
           const startTime = task.startTime ? ` at ${task.startTime}` : '';
           message += `${index + 1}. ${task.completed ? '✅' : '⬜'} ${task.title}${startTime}\n`;
         });
@@ -787,8 +1000,8 @@ Do not include any text outside the JSON structure. Ensure your message is conci
 
       // Add overdue tasks section if any
       if (digestData.overdueTasks.length > 0) {
-        message += `\n*Overdue Tasks (${digestData.overdueTasks.length}):*\n`;
-        digestData.overdueTasks.forEach((task: any, index: number) => {
+        message += `\n*Overdue Tasks (${digestData.overdueCount}):*\n`;
+        digestData.overdueTasks.forEach((task: TaskSummary, index: number) => {
           message += `${index + 1}. ⚠️ ${task.title} (due: ${task.date})\n`;
         });
       }
@@ -800,52 +1013,22 @@ Do not include any text outside the JSON structure. Ensure your message is conci
     return message;
   }
 
-  private formatRecentHistory(history: HistoryEntry[]): string {
+  private formatRecentHistory(history: readonly HistoryEntry[]): string {
     if (!history || history.length === 0) {
       return 'No recent conversation history.';
     }
 
-    // Limit to last 5 messages to avoid context length issues
-    const recentHistory = history.slice(-5);
-
-    return recentHistory
-      .map((entry) => {
-        const timestamp = entry.timestamp ? new Date(entry.timestamp).toLocaleTimeString() : '';
-        const role = entry.role === 'user' ? 'User' : 'Assistant';
-
-        // For assistant entries that might contain JSON tool calls, format them nicely
-        let content = entry.content;
-        if (
-          role === 'Assistant' &&
-          content.trim().startsWith('[') &&
-          content.trim().endsWith(']')
-        ) {
-          try {
-            const toolCalls = JSON.parse(content);
-            if (Array.isArray(toolCalls)) {
-              // Find reply tool calls to show in history
-              const replyTools = toolCalls.filter((tool) => tool.tool === 'reply');
-              if (replyTools.length > 0) {
-                content = replyTools.map((tool) => tool.params?.message || '').join('\n');
-              } else {
-                // If no reply tools, summarize the actions
-                content = `[Performed ${toolCalls.length} operations: ${toolCalls.map((t) => t.tool).join(', ')}]`;
-              }
-            }
-          } catch (e) {
-            // If parsing fails, use the original content
-          }
-        }
-
-        return `[${timestamp}] ${role}: ${content.substring(0, 400)}${content.length > 400 ? '...' : ''}`;
-      })
-      .join('\n\n');
+    // Limit to the last few messages to avoid context length issues
+    return this.promptBuilder.formatHistoryEntries(
+      history.slice(-RECENT_HISTORY_LIMIT),
+      MAX_HISTORY_ENTRY_LENGTH,
+    );
   }
 
   private async generateEveningCheckInWithLLM(checkInData: any): Promise<LlmResponse> {
     try {
       // Get recent conversation history
-      const history = this.historyService.getHistory();
+      const history = this.historyService.getRecentHistory(RECENT_HISTORY_LIMIT);
       const formattedHistory = this.formatRecentHistory(history);
 
       const systemInstruction = `You are an AI assistant tasked with creating personalized evening check-in summaries.
@@ -966,7 +1149,7 @@ Do not include any text outside the JSON structure. Ensure your message is conci
       // Add completed tasks section
       message += `*Выполнено сегодня (${checkInData.completedTasksToday.length}):*\n`;
       if (checkInData.completedTasksToday.length > 0) {
-        checkInData.completedTasksToday.forEach((task: any, index: number) => {
+        checkInData.completedTasksToday.forEach((task: TaskSummary, index: number) => {
           message += `${index + 1}. ✅ ${task.title}\n`;
         });
       } else {
@@ -976,7 +1159,7 @@ Do not include any text outside the JSON structure. Ensure your message is conci
       // Add uncompleted tasks section
       message += `\n*Остаются на выполнении (${checkInData.uncompletedTasksToday.length}):*\n`;
       if (checkInData.uncompletedTasksToday.length > 0) {
-        checkInData.uncompletedTasksToday.forEach((task: any, index: number) => {
+        checkInData.uncompletedTasksToday.forEach((task: TaskSummary, index: number) => {
           message += `${index + 1}. ⬜ ${task.title}\n`;
         });
       } else {
@@ -993,7 +1176,7 @@ Do not include any text outside the JSON structure. Ensure your message is conci
       // Add completed tasks section
       message += `*Completed Today (${checkInData.completedTasksToday.length}):*\n`;
       if (checkInData.completedTasksToday.length > 0) {
-        checkInData.completedTasksToday.forEach((task: any, index: number) => {
+        checkInData.completedTasksToday.forEach((task: TaskSummary, index: number) => {
           message += `${index + 1}. ✅ ${task.title}\n`;
         });
       } else {
@@ -1003,7 +1186,7 @@ Do not include any text outside the JSON structure. Ensure your message is conci
       // Add uncompleted tasks section
       message += `\n*Still Pending (${checkInData.uncompletedTasksToday.length}):*\n`;
       if (checkInData.uncompletedTasksToday.length > 0) {
-        checkInData.uncompletedTasksToday.forEach((task: any, index: number) => {
+        checkInData.uncompletedTasksToday.forEach((task: TaskSummary, index: number) => {
           message += `${index + 1}. ⬜ ${task.title}\n`;
         });
       } else {
@@ -1061,20 +1244,19 @@ Do not include any text outside the JSON structure. Ensure your message is conci
   async resetAndRescheduleRemindersForFile(filename: string): Promise<void> {
     try {
       this.logger.log(`Resetting and rescheduling reminders for file: ${filename}`);
-      // Remove any active reminders for this file
-      for (const [reminderId, reminder] of this.activeReminders) {
-        if (reminder.taskId && reminder.taskId.includes(filename)) {
-          this.schedulingService.unschedule(reminderId);
-          this.activeReminders.delete(reminderId);
-        }
-      }
-      // Find the task for this file and reschedule reminders
-      const todaysTasks = await this.taskAnalyzer.getTodaysTasks();
+      // Task file paths are relative to the tasks folder, watcher paths to the vault root
+      const taskFilePath = path.basename(filename);
 
-      for (const task of todaysTasks) {
-        if (!task.isCompleted()) {
-          await this.scheduleRemindersForTask(task);
-        }
+      // Remove any active reminders for this file
+      this.clearRemindersForFile(taskFilePath);
+
+      // Find the task for this file and reschedule reminders from its new contents
+      await this.taskAnalyzer.refreshTaskFile(filename);
+      const now = new Date();
+      const { uncompletedTasksToday } = await this.taskAnalyzer.getDayOverview(now);
+      const task = uncompletedTasksToday.find((t) => t.getFilePath() === taskFilePath);
+      if (task) {
+        await this.scheduleRemindersForTask(task, now);
       }
       this.logger.log(`Rescheduled reminders for file: ${filename}`);
     } catch (error) {
@@ -3,6 +3,9 @@ import { ISchedulingService } from '../../domain/interfaces/scheduling-service.i
 import { SchedulerRegistry } from '@nestjs/schedule';
 import { Timeout, Interval } from '@nestjs/schedule';
 
+// Longest delay setTimeout accepts (about 24.8 days); a longer one fires immediately
+const MAX_TIMEOUT_MS = 2 ** 31 - 1;
+
 /**
  * Implementation of the scheduling service using NestJS SchedulerRegistry
  */
@@ -106,6 +109,56 @@ export class SchedulingService implements ISchedulingService {
     }
   }
 
+  /**
+   * Run a job once at the given moment. Jobs further out than setTimeout allows wait in
+   * steps of at most MAX_TIMEOUT_MS and stay unschedulable under the same ID meanwhile
+   *
+   * @param runAt - When the job should run
+   * @param jobId - Unique identifier for the job
+   * @param callback - Function to execute when the job runs
+   */
+  addOneTimeJob(runAt: Date, jobId: string, callback: () => void): void {
+    // Unschedule existing job with the same ID if it exists
+    this.unschedule(jobId);
+
+    this.armOneTimeJob(runAt, jobId, callback);
+
+    this.logger.log(`Job scheduled: ${jobId} for ${runAt.toISOString()}`);
+  }
+
+  private armOneTimeJob(runAt: Date, jobId: string, callback: () => void): void {
+    const delay = runAt.getTime() - Date.now();
+
+    const timeoutId = setTimeout(
+      () => {
+        if (this.schedulerRegistry.doesExist('timeout', jobId)) {
+          this.schedulerRegistry.deleteTimeout(jobId);
+        }
+
+        // Only one step of a longer wait has passed
+        if (delay > MAX_TIMEOUT_MS) {
+          this.armOneTimeJob(runAt, jobId, callback);
+          return;
+        }
+
+        this.jobs.delete(jobId);
+        this.logger.log(`Executing scheduled job: ${jobId}`);
+        try {
+          callback();
+        } catch (error) {
+          this.logger.error(
+            `Error executing scheduled job ${jobId}: ${error.message}`,
+            error.stack,
+          );
+        }
+      },
+      Math.min(Math.max(0, delay), MAX_TIMEOUT_MS),
+    );
+
+    this.jobs.set(jobId, { intervalId: timeoutId, callback });
+    this.schedulerRegistry.addTimeout(jobId, timeoutId);
+  }
+
   /**
    * Remove a job from the schedule
    *
@@ -120,17 +173,12 @@ export class SchedulingService implements ISchedulingService {
         clearTimeout(job.intervalId);
         clearInterval(job.intervalId);
 
-        // Remove from registry
-        try {
+        // Remove from registry; a job is either a pending timeout or an interval
+        if (this.schedulerRegistry.doesExist('timeout', jobId)) {
           this.schedulerRegistry.deleteTimeout(jobId);
-        } catch (e) {
-          // Ignore if it wasn't a timeout
         }
-
-        try {
+        if (this.schedulerRegistry.doesExist('interval', jobId)) {
           this.schedulerRegistry.deleteInterval(jobId);
-        } catch (e) {
-          // Ignore if it wasn't an interval
         }
 
         // Remove from our map
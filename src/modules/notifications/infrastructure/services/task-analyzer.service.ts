@@ -1,53 +1,79 @@
 import { Injectable, Inject, Logger } from '@nestjs/common';
-import { ITaskAnalyzerService } from '../../domain/interfaces/task-analyzer-service.interface';
+import {
+  ITaskAnalyzerService,
+  TaskDayOverview,
+} from '../../domain/interfaces/task-analyzer-service.interface';
 import { Task, TaskData, TaskStatus } from '../../domain/models/task.model';
 import { IVaultService } from '../../../vault/domain/interfaces/vault-service.interface';
 import * as yaml from 'yaml';
 import * as path from 'path';
+import { randomUUID } from 'crypto';
 import { ConfigService } from 'src/shared/infrastructure/config/config.service';
 
+// How long a scan of the tasks folder is reused before the vault is read again
+const TASKS_CACHE_TTL_MS = 30 * 1000;
+// Task files read at once during a scan; a failed read (EMFILE) would silently drop a task
+const MAX_CONCURRENT_READS = 16;
+
+const FRONTMATTER_REGEX = /^---\n([\s\S]*?)\n---/;
+const DESCRIPTION_SECTION_REGEX = /## 📝 Описание\s*([\s\S]*?)(?:$|(?:\n## ))/;
+const DATE_ONLY_REGEX = /^(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$/;
+
+// Many task files share the same date strings, so parsed values are reused across scans
+const MAX_PARSED_DATES = 1024;
+const parsedDates = new Map<string, number>();
+
+function parseFrontmatterDate(value: unknown): Date {
+  if (typeof value !== 'string') {
+    return new Date(value as any);
+  }
+
+  let time = parsedDates.get(value);
+  if (time === undefined) {
+    if (parsedDates.size >= MAX_PARSED_DATES) {
+      parsedDates.clear();
+    }
+    // Plain YYYY-MM-DD dates skip the generic parser; like it, they mean UTC midnight
+    const dateOnly = DATE_ONLY_REGEX.exec(value);
+    time = dateOnly
+      ? Date.UTC(Number(dateOnly[1]), Number(dateOnly[2]) - 1, Number(dateOnly[3]))
+      : new Date(value).getTime();
+    parsedDates.set(value, time);
+  }
+  // Dates are mutable, so hand out a fresh instance every time
+  return new Date(time);
+}
+
 @Injectable()
 export class TaskAnalyzerService implements ITaskAnalyzerService {
   private readonly logger = new Logger(TaskAnalyzerService.name);
+  private tasksCache: { loadedAt: number; tasks: Promise<Task[]> } | null = null;
+  // Day overviews computed from a task snapshot, dropped together with the snapshot
+  private dayOverviews = new WeakMap<Task[], Map<number, TaskDayOverview>>();
+  // Sort keys of a snapshot as a parallel array, so binary searches compare plain numbers
+  private snapshotTimes = new WeakMap<Task[], number[]>();
+  // Tasks of a snapshot grouped by status, so status queries read one group instead of all tasks
+  private statusBuckets = new WeakMap<Task[], Map<TaskStatus, Task[]>>();
+  // Last parsed task per file, reused while the file content is unchanged
+  private parsedTasks = new Map<string, { content: string; task: Task | null }>();
 
   constructor(
     @Inject('IVaultService') private readonly vaultService: IVaultService,
     private readonly configService: ConfigService,
   ) {}
 
+  // The single-view queries share the memoised overview for the current day, so they
+  // read the clock once and agree with the digest about what "today" is
   async getTodaysTasks(): Promise<Task[]> {
-    const today = new Date();
-    return this.getTasksForDate(today);
+    return (await this.getDayOverview()).todaysTasks;
   }
 
   async getOverdueTasks(): Promise<Task[]> {
-    const today = new Date();
-    today.setHours(0, 0, 0, 0);
-
-    const allTasks = await this.getAllTasks();
-
-    return allTasks.filter((task) => {
-      const taskDate = task.getDate();
-      return !task.isCompleted() && taskDate instanceof Date && taskDate < today;
-    });
+    return (await this.getDayOverview()).overdueTasks;
   }
 
   async getCompletedTasksToday(): Promise<Task[]> {
-    const today = new Date();
-    today.setHours(0, 0, 0, 0);
-
-    const tomorrow = new Date(today);
-    tomorrow.setDate(tomorrow.getDate() + 1);
-
-    const allTasks = await this.getAllTasks();
-
-    return allTasks.filter(
-      (task) =>
-        task.isCompleted() &&
-        task.getDate() instanceof Date &&
-        task.getDate()! >= today &&
-        task.getDate()! < tomorrow,
-    );
+    return (await this.getDayOverview()).completedTasksToday;
   }
 
   async getPostponedTasks(): Promise<Task[]> {
@@ -55,71 +81,281 @@ export class TaskAnalyzerService implements ITaskAnalyzerService {
     // For now, we'll return tasks that are marked with a status of 'waiting'
     const allTasks = await this.getAllTasks();
 
-    return allTasks.filter(
-      (task) => !task.isCompleted() && task.getStatus() === TaskStatus.WAITING,
+    return (this.getStatusBuckets(allTasks).get(TaskStatus.WAITING) ?? []).filter(
+      (task) => !task.isCompleted(),
     );
   }
 
   async getTasksForDate(date: Date): Promise<Task[]> {
-    const targetDate = new Date(date);
-    targetDate.setHours(0, 0, 0, 0);
+    const [dayStart, nextDayStart] = this.getDayBounds(date);
 
-    const nextDate = new Date(targetDate);
-    nextDate.setDate(nextDate.getDate() + 1);
+    const allTasks = await this.getAllTasks();
+
+    return allTasks.slice(
+      this.lowerBound(allTasks, dayStart),
+      this.lowerBound(allTasks, nextDayStart),
+    );
+  }
+
+  async getDayOverview(date: Date = new Date()): Promise<TaskDayOverview> {
+    const [dayStart, nextDayStart] = this.getDayBounds(date);
 
+    // One snapshot and one pass for all views, so they can't disagree with each other
     const allTasks = await this.getAllTasks();
 
-    return allTasks.filter((task) => {
-      const taskDate = task.getDate();
-      return taskDate instanceof Date && taskDate >= targetDate && taskDate < nextDate;
-    });
+    // Digest, check-in and bot commands often ask for the same day in quick succession
+    let overviews = this.dayOverviews.get(allTasks);
+    if (!overviews) {
+      overviews = new Map();
+      this.dayOverviews.set(allTasks, overviews);
+    }
+    const cached = overviews.get(dayStart);
+    if (cached) {
+      return cached;
+    }
+
+    const todayIndex = this.lowerBound(allTasks, dayStart);
+    const nextDayIndex = this.lowerBound(allTasks, nextDayStart);
+
+    const overview: TaskDayOverview = {
+      todaysTasks: allTasks.slice(todayIndex, nextDayIndex),
+      overdueTasks: [],
+      completedTasksToday: [],
+      uncompletedTasksToday: [],
+    };
+
+    for (let i = 0; i < nextDayIndex; i++) {
+      const task = allTasks[i];
+      if (i < todayIndex) {
+        if (!task.isCompleted()) overview.overdueTasks.push(task);
+      } else if (task.isCompleted()) {
+        overview.completedTasksToday.push(task);
+      } else {
+        overview.uncompletedTasksToday.push(task);
+      }
+    }
+
+    overviews.set(dayStart, overview);
+    return overview;
   }
 
-  private async getAllTasks(): Promise<Task[]> {
+  /**
+   * Re-read a single changed task file and splice it into the cached, date-sorted
+   * list, instead of dropping the cache and re-reading the whole tasks folder
+   *
+   * @param relativePath - Path of the changed file relative to the vault root
+   */
+  async refreshTaskFile(relativePath: string): Promise<void> {
+    const tasksFolder = this.configService.getTasksFolder();
+    const inTasksFolder = path.relative(tasksFolder, path.dirname(relativePath)) === '';
+    if (!this.tasksCache || !inTasksFolder) {
+      return;
+    }
+
+    const file = path.basename(relativePath);
+
+    // The changed file can be read while a pending snapshot load finishes
+    const [tasks, content] = await Promise.all([
+      this.tasksCache.tasks,
+      this.vaultService.readFile(path.join(tasksFolder, file)),
+    ]);
+    const previousTask = this.parsedTasks.get(file)?.task ?? null;
+    const task = content ? this.getParsedTask(content, file) : null;
+    if (content) {
+      this.parsedTasks.set(file, { content, task });
+    } else {
+      this.parsedTasks.delete(file);
+    }
+
+    // Swap the entry without awaiting in between, so queries never see it missing;
+    // the parallel sort keys are spliced alongside
+    const times = this.snapshotTimes.get(tasks);
+    const existingIndex = this.findTaskIndex(tasks, previousTask, file);
+    if (existingIndex !== -1) {
+      tasks.splice(existingIndex, 1);
+      times?.splice(existingIndex, 1);
+    }
+    if (task) {
+      // Insert after any tasks with the same date to keep the sort stable
+      const time = this.getTaskTime(task);
+      const index = this.lowerBound(tasks, time + 1);
+      tasks.splice(index, 0, task);
+      times?.splice(index, 0, time);
+    }
+    this.dayOverviews.delete(tasks);
+    this.statusBuckets.delete(tasks);
+  }
+
+  /**
+   * Locate a file's entry in the sorted snapshot. The previously parsed task gives its sort
+   * key, so a binary search finds the run of equal dates and only that run is scanned;
+   * the full scan is a fallback for entries whose previous parse is unknown.
+   */
+  private findTaskIndex(tasks: Task[], previousTask: Task | null, file: string): number {
+    if (previousTask) {
+      const time = this.getTaskTime(previousTask);
+      const times = this.snapshotTimes.get(tasks);
+      for (let i = this.lowerBound(tasks, time); i < tasks.length; i++) {
+        if ((times ? times[i] : this.getTaskTime(tasks[i])) !== time) break;
+        if (tasks[i].getFilePath() === file) return i;
+      }
+    }
+    return tasks.findIndex((existing) => existing.getFilePath() === file);
+  }
+
+  /**
+   * Group a task snapshot by status in one pass, keeping the date order within each group
+   */
+  private getStatusBuckets(tasks: Task[]): Map<TaskStatus, Task[]> {
+    let buckets = this.statusBuckets.get(tasks);
+    if (!buckets) {
+      buckets = new Map();
+      for (const task of tasks) {
+        const status = task.getStatus();
+        const bucket = buckets.get(status);
+        if (bucket) {
+          bucket.push(task);
+        } else {
+          buckets.set(status, [task]);
+        }
+      }
+      this.statusBuckets.set(tasks, buckets);
+    }
+    return buckets;
+  }
+
+  /**
+   * Get the local-midnight epoch milliseconds of the given day and the day after,
+   * so range checks are plain number comparisons
+   */
+  private getDayBounds(date: Date): [number, number] {
+    const dayStart = new Date(date.getFullYear(), date.getMonth(), date.getDate());
+    const nextDayStart = new Date(date.getFullYear(), date.getMonth(), date.getDate() + 1);
+    return [dayStart.getTime(), nextDayStart.getTime()];
+  }
+
+  /**
+   * Sort key for tasks: epoch milliseconds of the task date, undated tasks last
+   */
+  private getTaskTime(task: Task): number {
+    const time = task.getDate()?.getTime();
+    return time === undefined || isNaN(time) ? Infinity : time;
+  }
+
+  /**
+   * Binary search for the index of the first task dated at or after `time`
+   * in a list sorted by getTaskTime, using the snapshot's sort keys when it has them
+   */
+  private lowerBound(tasks: Task[], time: number): number {
+    const times = this.snapshotTimes.get(tasks);
+    let low = 0;
+    let high = tasks.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if ((times ? times[mid] : this.getTaskTime(tasks[mid])) < time) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+
+  /**
+   * Return all tasks from the tasks folder. A digest asks for several task views
+   * in a row, so one scan is shared between them (and between concurrent callers)
+   * for a short while instead of re-reading every file each time. The list is
+   * sorted by task date so date ranges can be sliced out with a binary search.
+   */
+  private getAllTasks(): Promise<Task[]> {
+    const now = Date.now();
+    if (!this.tasksCache || now - this.tasksCache.loadedAt >= TASKS_CACHE_TTL_MS) {
+      this.tasksCache = { loadedAt: now, tasks: this.loadAllTasks() };
+    }
+    return this.tasksCache.tasks;
+  }
+
+  private async loadAllTasks(): Promise<Task[]> {
     try {
-      // Check if tasks folder exists
-      if (!(await this.vaultService.folderExists(this.configService.getTasksFolder()))) {
+      // Get all markdown files in the tasks folder; a missing folder lists as undefined
+      const files = await this.vaultService.listFiles(this.configService.getTasksFolder());
+      if (!files) {
         this.logger.warn(
           `Tasks folder '${this.configService.getTasksFolder()}' not found in vault`,
         );
         return [];
       }
-
-      // Get all markdown files in the tasks folder
-      const files = await this.vaultService.listFiles(this.configService.getTasksFolder());
-      if (!files || files.length === 0) {
+      if (files.length === 0) {
         return [];
       }
 
       const tasks: Task[] = [];
+      const parsedTasks = new Map<string, { content: string; task: Task | null }>();
+
+      // Overlap the reads, but keep a bounded number of files open at any time
+      const tasksFolder = this.configService.getTasksFolder();
+      const markdownFiles = files.filter((file) => file.endsWith('.md'));
+      const contents: (string | undefined)[] = new Array(markdownFiles.length);
+      let next = 0;
+      const readNext = async (): Promise<void> => {
+        while (next < markdownFiles.length) {
+          const i = next++;
+          contents[i] = await this.vaultService.readFile(path.join(tasksFolder, markdownFiles[i]));
+        }
+      };
+      await Promise.all(
+        Array.from({ length: Math.min(MAX_CONCURRENT_READS, markdownFiles.length) }, readNext),
+      );
 
       // Process each file
-      for (const file of files) {
-        if (!file.endsWith('.md')) continue;
-
-        // Join the tasks folder path with the filename
-        const fullPath = path.join(this.configService.getTasksFolder(), file);
-        const content = await this.vaultService.readFile(fullPath);
+      for (let i = 0; i < markdownFiles.length; i++) {
+        const file = markdownFiles[i];
+        const content = contents[i];
 
         if (!content) continue;
 
-        const task = this.parseTaskFromContent(content, file);
+        const task = this.getParsedTask(content, file);
+        parsedTasks.set(file, { content, task });
         if (task) {
           tasks.push(task);
         }
       }
 
-      return tasks;
+      // Only keep parse results for files that still exist
+      this.parsedTasks = parsedTasks;
+
+      // Compute each sort key once and sort indices by it, instead of reading
+      // two task dates per comparison; compare rather than subtract, undated tasks are Infinity
+      const times = tasks.map((task) => this.getTaskTime(task));
+      const order = tasks
+        .map((_, i) => i)
+        .sort((a, b) => (times[a] < times[b] ? -1 : times[a] > times[b] ? 1 : 0));
+
+      const sortedTasks = order.map((i) => tasks[i]);
+      this.snapshotTimes.set(sortedTasks, order.map((i) => times[i]));
+      return sortedTasks;
     } catch (error) {
       this.logger.error(`Error getting all tasks: ${error.message}`, error.stack);
       return [];
     }
   }
 
+  /**
+   * Parse a task file, reusing the previous result while its content is unchanged.
+   * This skips the YAML parse on rescans and keeps task IDs stable between them.
+   */
+  private getParsedTask(content: string, filePath: string): Task | null {
+    const cached = this.parsedTasks.get(filePath);
+    if (cached && cached.content === content) {
+      return cached.task;
+    }
+    return this.parseTaskFromContent(content, filePath);
+  }
+
   private parseTaskFromContent(content: string, filePath: string): Task | null {
     try {
       // Extract frontmatter
-      const frontmatterMatch = content.match(/^---\n([\s\S]*?)\n---/);
+      const frontmatterMatch = FRONTMATTER_REGEX.exec(content);
       if (!frontmatterMatch) return null;
 
       const frontmatter = yaml.parse(frontmatterMatch[1]);
@@ -130,17 +366,17 @@ export class TaskAnalyzerService implements ITaskAnalyzerService {
       let endDate: Date | undefined;
 
       if (frontmatter.date) {
-        date = new Date(frontmatter.date);
+        date = parseFrontmatterDate(frontmatter.date);
       }
 
       if (frontmatter.endDate) {
-        endDate = new Date(frontmatter.endDate);
+        endDate = parseFrontmatterDate(frontmatter.endDate);
       }
 
       // Create task data
       const taskData: TaskData = {
         title: frontmatter.title || path.basename(filePath, '.md'),
-        description: this.extractDescription(content),
+        description: this.extractDescription(content.slice(frontmatterMatch[0].length)),
         date,
         endDate,
         startTime: frontmatter.startTime,
@@ -165,12 +401,14 @@ export class TaskAnalyzerService implements ITaskAnalyzerService {
     }
   }
 
-  private extractDescription(content: string): string {
-    // Remove frontmatter
-    const withoutFrontmatter = content.replace(/^---\n[\s\S]*?\n---/, '').trim();
+  /**
+   * Extract the description section from the note body (content after the frontmatter)
+   */
+  private extractDescription(body: string): string {
+    const withoutFrontmatter = body.trim();
 
     // Look for description section
-    const descriptionMatch = withoutFrontmatter.match(/## 📝 Описание\s*([\s\S]*?)(?:$|(?:\n## ))/);
+    const descriptionMatch = DESCRIPTION_SECTION_REGEX.exec(withoutFrontmatter);
 
     if (descriptionMatch && descriptionMatch[1]) {
       return descriptionMatch[1].trim();
@@ -181,10 +419,6 @@ export class TaskAnalyzerService implements ITaskAnalyzerService {
 
   // Simple UUID generator
   private generateId(): string {
-    return 'xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'.replace(/[xy]/g, function (c) {
-      const r = (Math.random() * 16) | 0;
-      const v = c === 'x' ? r : (r & 0x3) | 0x8;
-      return v.toString(16);
-    });
+    return randomUUID();
   }
 }
@@ -64,21 +64,18 @@ export class NotificationsController {
   async broadcastMorningDigest(): Promise<{ success: boolean; message: string }> {
     try {
       this.logger.log('Broadcasting morning digest to all users');
-      const userIds = this.configService.getTelegramUserIds();
-      const results = [];
-
-      for (const userId of userIds) {
-        try {
-          const numericUserId = parseInt(userId, 10);
-          if (!isNaN(numericUserId)) {
-            const result = await this.notificationService.sendMorningDigest(numericUserId);
-            results.push({ userId: numericUserId, success: result });
+      const userIds = this.configService.getTelegramUserIdNumbers();
+      const results = await Promise.all(
+        userIds.map(async (userId) => {
+          try {
+            const result = await this.notificationService.sendMorningDigest(userId);
+            return { userId, success: result };
+          } catch (error) {
+            this.logger.error(`Error sending morning digest to user ${userId}:`, error);
+            return { userId, success: false, error: error.message };
           }
-        } catch (error) {
-          this.logger.error(`Error sending morning digest to user ${userId}:`, error);
-          results.push({ userId, success: false, error: error.message });
-        }
-      }
+        }),
+      );
 
       const successCount = results.filter((r) => r.success).length;
       return {
@@ -99,21 +96,18 @@ export class NotificationsController {
   async broadcastEveningCheckIn(): Promise<{ success: boolean; message: string }> {
     try {
       this.logger.log('Broadcasting evening check-in to all users');
-      const userIds = this.configService.getTelegramUserIds();
-      const results = [];
-
-      for (const userId of userIds) {
-        try {
-          const numericUserId = parseInt(userId, 10);
-          if (!isNaN(numericUserId)) {
-            const result = await this.notificationService.sendEveningCheckIn(numericUserId);
-            results.push({ userId: numericUserId, success: result });
+      const userIds = this.configService.getTelegramUserIdNumbers();
+      const results = await Promise.all(
+        userIds.map(async (userId) => {
+          try {
+            const result = await this.notificationService.sendEveningCheckIn(userId);
+            return { userId, success: result };
+          } catch (error) {
+            this.logger.error(`Error sending evening check-in to user ${userId}:`, error);
+            return { userId, success: false, error: error.message };
           }
-        } catch (error) {
-          this.logger.error(`Error sending evening check-in to user ${userId}:`, error);
-          results.push({ userId, success: false, error: error.message });
-        }
-      }
+        }),
+      );
 
       const successCount = results.filter((r) => r.success).length;
       return {
@@ -15,15 +15,7 @@ import { SchedulingService } from './infrastructure/services/scheduling.service'
 
 // Controllers
 import { NotificationsController } from './interface/controllers/notifications.controller';
-import { ProcessMessageService } from '../telegram/application/services/process-message.service';
-import { ToolsRegistryService } from '../tools/application/services/tools-registry.service';
-import { CreateFileToolHandler } from '../tools/infrastructure/services/file-tools.service';
-import { ModifyFileToolHandler } from '../tools/infrastructure/services/file-tools.service';
-import { DeleteFileToolHandler } from '../tools/infrastructure/services/file-tools.service';
-import { ReplyToolHandler } from '../tools/infrastructure/services/file-tools.service';
-import { FinishToolHandler } from '../tools/infrastructure/services/file-tools.service';
-import { FilePathService } from '../tools/infrastructure/services/file-path.service';
-import { VaultService } from '../vault/infrastructure/services/vault.service';
+
 @Module({
   imports: [
     VaultModule,
@@ -39,15 +31,6 @@ import { VaultService } from '../vault/infrastructure/services/vault.service';
     NotificationService,
     TaskAnalyzerService,
     SchedulingService,
-    VaultService,
-    ProcessMessageService,
-    ToolsRegistryService,
-    CreateFileToolHandler,
-    ModifyFileToolHandler,
-    DeleteFileToolHandler,
-    ReplyToolHandler,
-    FinishToolHandler,
-    FilePathService,
   ],
   controllers: [NotificationsController],
   exports: [
@@ -1,13 +0,0 @@
-// import { Module, Global } from '@nestjs/common';
-// import { CqrsModule } from '@nestjs/cqrs';
-// import { SendMessageHandler } from '../telegram/application/commands/send-message.handler';
-
-// const CommandHandlers = [SendMessageHandler];
-
-// @Global()
-// @Module({
-//   imports: [CqrsModule],
-//   providers: [...CommandHandlers],
-//   exports: [...CommandHandlers, CqrsModule],
-// })
-// export class SharedModule {}
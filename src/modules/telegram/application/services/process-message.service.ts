@@ -1,4 +1,5 @@
 import { Inject, Logger, forwardRef, Injectable } from '@nestjs/common';
+import * as path from 'path';
 import {
   LlmProcessorService,
   LlmResponse,
@@ -9,6 +10,12 @@ import { ToolsRegistryService } from '../../../tools/application/services/tools-
 import { VaultService } from 'src/modules/vault/infrastructure/services/vault.service';
 import { MessageDto } from '../../interface/dtos/message.dto';
 
+// Upper bound on the vault text sent to the LLM with every message
+const MAX_VAULT_CONTEXT_LENGTH = 150000;
+// Longest text Telegram accepts in a single message
+const TELEGRAM_MESSAGE_LIMIT = 4096;
+const FILE_TOOLS = new Set(['create_file', 'modify_file', 'delete_file']);
+
 @Injectable()
 export class ProcessMessageService {
   private readonly logger = new Logger(ProcessMessageService.name);
@@ -28,15 +35,7 @@ export class ProcessMessageService {
     try {
       const vaultFiles = await this.vaultService.readAllMarkdownFiles();
       if (vaultFiles && Object.keys(vaultFiles).length > 0) {
-        const vaultContextParts = Object.entries(vaultFiles).map(
-          ([path, content]) => `File: ${path}\n\n\`\`\`\n${content}\n\`\`\`\n\n`,
-        );
-        vaultContext = vaultContextParts.join('');
-
-        // Truncate if too large
-        if (vaultContext.length > 150000) {
-          vaultContext = vaultContext.substring(0, 150000) + '\n... (truncated)';
-        }
+        vaultContext = this.buildVaultContext(vaultFiles);
       }
     } catch (error) {
       this.logger.error('Error reading vault files:', error);
@@ -55,27 +54,151 @@ export class ProcessMessageService {
     }
   }
 
+  /**
+   * Pack whole vault files into the context budget. A file that does not fit is skipped
+   * rather than cut off, so the remaining space can still be filled by smaller files.
+   */
+  private buildVaultContext(vaultFiles: Record<string, string>): string {
+    const parts: string[] = [];
+    let length = 0;
+    let omitted = 0;
+
+    for (const [path, content] of Object.entries(vaultFiles)) {
+      const part = `File: ${path}\n\n\`\`\`\n${content}\n\`\`\`\n\n`;
+      if (length + part.length > MAX_VAULT_CONTEXT_LENGTH) {
+        omitted++;
+        continue;
+      }
+      parts.push(part);
+      length += part.length;
+    }
+
+    if (omitted > 0) {
+      this.logger.debug(`Vault context is full, omitted ${omitted} files`);
+      parts.push(`... (${omitted} files omitted)`);
+    }
+    return parts.join('');
+  }
+
+  /**
+   * Fold back-to-back replies to the same recipient into one message while it stays
+   * within Telegram's length limit, so they cost one API round-trip instead of several
+   */
+  private mergeConsecutiveReplies(toolCalls: any[]): any[] {
+    const merged: any[] = [];
+    // The reply being extended and its message parts, joined once when the run ends
+    let runCall: any = null;
+    let runMessages: string[] = [];
+    let runLength = 0;
+
+    const flush = (): void => {
+      if (!runCall) return;
+      merged.push(
+        runMessages.length === 1
+          ? runCall
+          : { ...runCall, params: { ...runCall.params, message: runMessages.join('\n\n') } },
+      );
+      runCall = null;
+    };
+
+    for (const toolCall of toolCalls) {
+      const message = toolCall.params?.message;
+      if (toolCall.tool !== 'reply' || typeof message !== 'string') {
+        flush();
+        merged.push(toolCall);
+        continue;
+      }
+
+      const canMerge =
+        runCall &&
+        runCall.params.chat_id === toolCall.params.chat_id &&
+        runCall.params.user_id === toolCall.params.user_id &&
+        runLength + message.length + 2 <= TELEGRAM_MESSAGE_LIMIT;
+
+      if (canMerge) {
+        runMessages.push(message);
+        runLength += message.length + 2;
+      } else {
+        flush();
+        runCall = toolCall;
+        runMessages = [message];
+        runLength = message.length;
+      }
+    }
+    flush();
+    return merged;
+  }
+
   public async executeToolCalls(
     response: LlmResponse,
-    userId?: string,
+    userId?: number,
     chatId?: number,
   ): Promise<void> {
     if (response.toolCalls && Array.isArray(response.toolCalls) && response.toolCalls.length > 0) {
       this.logger.debug(`Executing ${response.toolCalls.length} tool calls`);
-      for (const toolCall of response.toolCalls) {
-        const { tool, params } = toolCall;
+
+      // File tools touching different paths are independent, so they run side by side;
+      // any other tool (reply, finish) waits for the writes before it and keeps its order
+      let batch: Promise<void>[] = [];
+      let batchPaths = new Set<string>();
+
+      // executeTool reports failures as results, so one failed call never stops the others;
+      // they are collected and logged together once every call has run
+      const failures: string[] = [];
+      const run = async (tool: string, params: Record<string, any>): Promise<void> => {
+        const result = await this.toolsRegistry.executeTool(tool, params);
+        if (result?.status === 'error') {
+          failures.push(`${tool}: ${result.message}`);
+        }
+      };
+
+      const toolCalls = this.mergeConsecutiveReplies(response.toolCalls);
+      for (const toolCall of toolCalls) {
+        const { tool } = toolCall;
+        let { params } = toolCall;
         this.logger.debug(`Executing tool: ${tool}`);
 
-        // Add chat_id to params if not present for appropriate tools
-        if (tool === 'reply' && params && !params.chat_id) {
-          params.chat_id = chatId;
+        // Fill in the recipient on a copy: the same response may be sent to several users
+        if (tool === 'reply' && params) {
+          params = {
+            ...params,
+            chat_id: params.chat_id || chatId,
+            user_id: params.user_id || userId,
+          };
         }
 
-        if (tool === 'reply' && params && !params.user_id) {
-          params.user_id = userId;
+        // Key the batch on the normalized path, as the file tools join it onto the vault
+        // root: './Tasks/a.md' and 'Tasks/a.md' are the same file and must not run together
+        const filePath =
+          FILE_TOOLS.has(tool) && typeof params?.file_path === 'string' && params.file_path
+            ? path.normalize(params.file_path)
+            : undefined;
+        if (!filePath || batchPaths.has(filePath)) {
+          await Promise.all(batch);
+          batch = [];
+          batchPaths = new Set<string>();
         }
 
-        await this.toolsRegistry.executeTool(tool, params);
+        if (!filePath) {
+          await run(tool, params);
+          continue;
+        }
+
+        batch.push(run(tool, params));
+        batchPaths.add(filePath);
+      }
+
+      await Promise.all(batch);
+
+      // File tools write to the vault directly, so the shared vault read is stale now
+      if (toolCalls.some(({ tool }) => FILE_TOOLS.has(tool))) {
+        this.vaultService.invalidateMarkdownFiles();
+      }
+
+      if (failures.length > 0) {
+        this.logger.warn(
+          `${failures.length} of ${toolCalls.length} tool calls failed: ${failures.join('; ')}`,
+        );
       }
     } else {
       // Fallback error case - should never happen with updated LlmProcessorService
@@ -3,48 +3,53 @@ import { TelegramService } from '../../infrastructure/services/telegram.service'
 import { MessageDto } from '../../interface/dtos/message.dto';
 import { ConfigService } from '../../../../shared/infrastructure/config/config.service';
 import { ProcessMessageService } from '../services/process-message.service';
-import { ModuleRef } from '@nestjs/core';
 import { Logger } from '@nestjs/common';
 import { INotificationService } from '../../../notifications/domain/interfaces/notification-service.interface';
 import { NotificationService } from 'src/modules/notifications/infrastructure/services/notification.service';
 import { GeminiService } from '../../../llm/infrastructure/services/gemini.service';
 import * as path from 'path';
-import * as fs from 'fs';
+import * as fs from 'fs/promises';
+
+// A leading "/command" or "/command@BotName" token
+const BOT_COMMAND_REGEX = /^\/\w+(?:@\w+)?(?:\s|$)/;
 
 @Injectable()
 export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
-  private allowedUserIds: number[] = [];
+  private readonly allowedUserIds: ReadonlySet<number>;
   private readonly logger = new Logger(TelegramAppService.name);
 
   constructor(
     private readonly telegramService: TelegramService,
     private readonly configService: ConfigService,
     private readonly processMessageService: ProcessMessageService,
-    private readonly moduleRef: ModuleRef,
     @Inject(forwardRef(() => NotificationService))
     private readonly notificationService: NotificationService,
     private readonly geminiService: GeminiService,
   ) {
     // Get allowed user IDs from config
-    const userIds = this.configService.getTelegramUserIds();
-    this.allowedUserIds = userIds.map((id) => parseInt(id, 10)).filter((id) => !isNaN(id));
+    this.allowedUserIds = new Set(this.configService.getTelegramUserIdNumbers());
   }
 
   async onModuleInit(): Promise<void> {
     const bot = this.telegramService.getBot();
 
     // Set up message handler
-    bot.on('message', async (ctx) => {
+    bot.on('message', async (ctx, next) => {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
       // Set current context for potential direct replies
       this.telegramService.setCurrentContext(ctx.update, ctx);
 
+      // Bot commands are answered by the command handlers below, never by the LLM
+      if (ctx.message && 'text' in ctx.message && BOT_COMMAND_REGEX.test(ctx.message.text)) {
+        return next();
+      }
+
       // Process text messages
       if (ctx.message && 'text' in ctx.message && ctx.message.text) {
         const chatId = ctx.chat.id;
@@ -70,12 +75,13 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
           const userId = ctx.from?.id;
           // Use a temp file path
           const tempDir = path.join(process.cwd(), 'temp');
-          if (!fs.existsSync(tempDir)) {
-            fs.mkdirSync(tempDir);
-          }
+          await fs.mkdir(tempDir, { recursive: true });
           const tempFilePath = path.join(tempDir, `${fileId}.ogg`);
-          await ctx.reply('⏳ Downloading and transcribing your voice message...');
-          await this.telegramService.downloadFile(fileId, tempFilePath);
+          // The status reply and the download are independent round-trips, so overlap them
+          await Promise.all([
+            ctx.reply('⏳ Downloading and transcribing your voice message...'),
+            this.telegramService.downloadFile(fileId, tempFilePath),
+          ]);
           // Transcribe using Gemini
           let transcription: string | null = null;
           try {
@@ -84,9 +90,7 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
             this.logger.error('Error during Gemini transcription:', err);
           }
           // Clean up temp file
-          try {
-            fs.unlinkSync(tempFilePath);
-          } catch {}
+          await fs.rm(tempFilePath, { force: true }).catch(() => {});
           if (
             transcription &&
             typeof transcription === 'string' &&
@@ -110,7 +114,7 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
@@ -121,7 +125,7 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
@@ -140,7 +144,7 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
@@ -153,20 +157,27 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
       try {
-        await ctx.reply('🔄 Resetting all notifications...');
-
-        try {
-          // Use the injected notification service
-          await this.notificationService.resetAndRescheduleAllReminders();
+        // Reset while the status message is in flight; a reset failure is reported, not thrown
+        const [, resetError] = await Promise.all([
+          ctx.reply('🔄 Resetting all notifications...'),
+          this.notificationService.resetAndRescheduleAllReminders().then(
+            () => null,
+            (error) => error,
+          ),
+        ]);
+
+        if (resetError) {
+          this.logger.error('Error resetting notifications:', resetError);
+          await ctx.reply(
+            `❌ Failed to reset notifications: ${resetError.message || 'Unknown error'}`,
+          );
+        } else {
           await ctx.reply('✅ All notifications have been reset and rescheduled successfully.');
-        } catch (error) {
-          this.logger.error('Error resetting notifications:', error);
-          await ctx.reply(`❌ Failed to reset notifications: ${error.message || 'Unknown error'}`);
         }
       } catch (error) {
         this.logger.error('Error handling reset_notifications command:', error);
@@ -179,7 +190,7 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
@@ -201,7 +212,7 @@ export class TelegramAppService implements OnModuleInit, OnModuleDestroy {
       const userId = ctx.from?.id;
 
       // Check if user is allowed
-      if (!userId || !this.allowedUserIds.includes(userId)) {
+      if (!userId || !this.allowedUserIds.has(userId)) {
         return;
       }
 
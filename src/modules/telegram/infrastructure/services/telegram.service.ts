@@ -7,6 +7,10 @@ import * as fs from 'fs';
 
 type ParseMode = 'Markdown' | 'MarkdownV2' | 'HTML';
 
+// One keep-alive connection pool for Bot API calls and file downloads alike,
+// so each request does not pay for a fresh TCP and TLS handshake
+const telegramAgent = new https.Agent({ keepAlive: true, maxSockets: 20 });
+
 @Injectable()
 export class TelegramService implements ITelegramService {
   private bot: Telegraf;
@@ -20,7 +24,7 @@ export class TelegramService implements ITelegramService {
       throw new Error('Telegram bot token is not configured');
     }
 
-    this.bot = new Telegraf(token);
+    this.bot = new Telegraf(token, { telegram: { agent: telegramAgent } });
   }
 
   setCurrentContext(update: any, context: any): void {
@@ -142,31 +146,9 @@ export class TelegramService implements ITelegramService {
   private sanitizeMarkdown(text: string): string {
     if (!text) return '';
 
-    // Fix common markdown issues
-    let sanitized = text;
-
-    // Fix unclosed asterisks
-    const asteriskCount = (sanitized.match(/\*/g) || []).length;
-    if (asteriskCount % 2 !== 0) {
-      sanitized = sanitized.replace(/\*([^*]*)$/g, '*$1');
-    }
-
-    // Fix unclosed underscores
-    const underscoreCount = (sanitized.match(/_/g) || []).length;
-    if (underscoreCount % 2 !== 0) {
-      sanitized = sanitized.replace(/_([^_]*)$/g, '_$1');
-    }
-
-    // Fix unclosed backticks
-    const backtickCount = (sanitized.match(/`/g) || []).length;
-    if (backtickCount % 2 !== 0) {
-      sanitized = sanitized.replace(/`([^`]*)$/g, '`$1');
-    }
-
-    // Fix lists with asterisks that might be confused with bold/italic markers
-    sanitized = sanitized.replace(/^\s*\*\s+/gm, '• ');
-
-    return sanitized;
+    // Fix lists with asterisks that might be confused with bold/italic markers; any other
+    // markup Telegram rejects is handled by the plain-text retry in sendMessage
+    return text.replace(/^\s*\*\s+/gm, '• ');
   }
 
   // Additional methods for the Telegram bot
@@ -204,7 +186,7 @@ export class TelegramService implements ITelegramService {
       await new Promise<void>((resolve, reject) => {
         const fileStream = fs.createWriteStream(destPath);
         https
-          .get(fileUrl, (response) => {
+          .get(fileUrl, { agent: telegramAgent }, (response) => {
             response.pipe(fileStream);
             fileStream.on('finish', () => {
               fileStream.close();
@@ -18,6 +18,6 @@ import { SendMessageService } from './application/services/send-message.service'
     forwardRef(() => NotificationsModule),
   ],
   providers: [TelegramService, TelegramAppService, SendMessageService, ProcessMessageService],
-  exports: [TelegramService, TelegramAppService, SendMessageService],
+  exports: [TelegramService, TelegramAppService, SendMessageService, ProcessMessageService],
 })
 export class TelegramModule {}
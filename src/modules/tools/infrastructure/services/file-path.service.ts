@@ -1,6 +1,6 @@
 import { Injectable, Logger } from '@nestjs/common';
-import { ConfigService } from '@nestjs/config';
 import * as path from 'path';
+import { ConfigService } from '../../../../shared/infrastructure/config/config.service';
 
 /**
  * Service for handling file paths with base path configuration
@@ -13,9 +13,9 @@ export class FilePathService {
   constructor(private readonly configService: ConfigService) {
     // Try different environment variable names for the vault path
     this.basePath =
-      this.configService.get<string>('OBSIDIAN_VAULT_PATH') ||
-      this.configService.get<string>('VAULT_PATH') ||
-      this.configService.get<string>('VAULT_DIR') ||
+      this.configService.getObsidianVaultPath() ||
+      this.configService.getStr('VAULT_PATH') ||
+      this.configService.getStr('VAULT_DIR') ||
       process.cwd();
 
     this.logger.log(`Initialized FilePathService with base path: ${this.basePath}`);
@@ -5,6 +5,14 @@ import * as path from 'path';
 import { FilePathService } from './file-path.service';
 import { SendMessageService } from '../../../telegram/application/services/send-message.service';
 
+/**
+ * Telegram IDs arrive as numbers from the app and as strings from LLM tool calls;
+ * only the latter need parsing
+ */
+function toNumericId(value: number | string): number {
+  return typeof value === 'number' ? value : parseInt(value, 10);
+}
+
 /**
  * Tool implementation for creating files
  */
@@ -209,7 +217,7 @@ export class ReplyToolHandler implements IToolHandler {
 
       // If chat_id is provided, prioritize it
       if (chat_id) {
-        const numericChatId = parseInt(chat_id, 10);
+        const numericChatId = toNumericId(chat_id);
         if (isNaN(numericChatId)) {
           this.logger.error(`Invalid chat_id: ${chat_id}`);
           return {
@@ -239,7 +247,7 @@ export class ReplyToolHandler implements IToolHandler {
       }
 
       // If we reached here, we must have a user_id but no chat_id
-      const numericUserId = parseInt(user_id, 10);
+      const numericUserId = toNumericId(user_id);
       if (isNaN(numericUserId)) {
         this.logger.error(`Invalid user_id: ${user_id}`);
         return {
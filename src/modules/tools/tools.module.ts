@@ -10,7 +10,6 @@ import { FilePathService } from './infrastructure/services/file-path.service';
 import { VaultModule } from '../vault/vault.module';
 import { ToolsRegistryService } from './application/services/tools-registry.service';
 import { TelegramModule } from '../telegram/telegram.module';
-import { ConfigModule } from '@nestjs/config';
 import { SharedModule } from '../../shared/shared.module';
 // import { SendMessageHandler } from '../telegram/application/commands/send-message.handler';
 import { DiscoveryModule } from '@nestjs/core';
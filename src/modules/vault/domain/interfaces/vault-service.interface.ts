@@ -22,4 +22,6 @@ export interface IVaultService {
   listFiles(relativePath?: string): Promise<string[] | undefined>;
 
   readAllMarkdownFiles(): Promise<Record<string, string>>;
+
+  invalidateMarkdownFiles(): void;
 }
@@ -14,10 +14,18 @@ const fsMkdir = promisify(fs.mkdir);
 const fsRm = promisify(fs.rm);
 const fsStat = promisify(fs.stat);
 
+// How long a full vault read is reused; changes seen by the watcher or made through
+// this service drop it sooner, the TTL only bounds staleness if the watcher misses one
+const MARKDOWN_FILES_TTL_MS = 30 * 1000;
+// Markdown files read at once; a failed read (EMFILE) would leave a file out of the context
+const MAX_CONCURRENT_READS = 16;
+
 @Injectable()
 export class VaultService implements IVaultService {
   public readonly fileEvents = new EventEmitter();
   private watcher: fs.FSWatcher | null = null;
+  private markdownFiles: { expiresAt: number; files: Promise<Record<string, string>> } | null =
+    null;
 
   constructor(private readonly configService: ConfigService) {
     this.initFileWatcher();
@@ -31,6 +39,8 @@ export class VaultService implements IVaultService {
     }
     try {
       this.watcher = fs.watch(vaultRoot, { recursive: true }, (eventType, filename) => {
+        // Any change, including renamed or removed folders, can alter the markdown files
+        this.markdownFiles = null;
         if (filename && filename.endsWith('.md')) {
           // Emit event for changed markdown file
           this.fileEvents.emit('fileChanged', filename);
@@ -79,6 +89,7 @@ export class VaultService implements IVaultService {
 
       // Write the file
       await fsWriteFile(absolutePath, content, 'utf8');
+      this.invalidateMarkdownFiles();
       return true;
     } catch (error) {
       console.error(`Error creating file ${relativePath}:`, error);
@@ -102,6 +113,7 @@ export class VaultService implements IVaultService {
 
       // Write the file
       await fsWriteFile(absolutePath, content, 'utf8');
+      this.invalidateMarkdownFiles();
       return true;
     } catch (error) {
       console.error(`Error modifying file ${relativePath}:`, error);
@@ -125,6 +137,7 @@ export class VaultService implements IVaultService {
 
       // Delete the file
       await fsRm(absolutePath);
+      this.invalidateMarkdownFiles();
       return true;
     } catch (error) {
       console.error(`Error deleting file ${relativePath}:`, error);
@@ -201,20 +214,14 @@ export class VaultService implements IVaultService {
     }
 
     try {
-      // Check if file exists
-      console.log(`Attempting to read file at: ${absolutePath}`);
-      const exists = await fsExists(absolutePath);
-      if (!exists) {
+      // Read directly and treat ENOENT as missing, rather than stat-ing the path first
+      return await fsReadFile(absolutePath, 'utf8');
+    } catch (error) {
+      if (error.code === 'ENOENT') {
         console.error(`File does not exist at path: ${absolutePath}`);
-        return undefined;
+      } else {
+        console.error(`Error reading file ${relativePath}:`, error);
       }
-
-      // Read the file
-      const content = await fsReadFile(absolutePath, 'utf8');
-      console.log(`Successfully read file with size: ${content.length} bytes`);
-      return content;
-    } catch (error) {
-      console.error(`Error reading file ${relativePath}:`, error);
       return undefined;
     }
   }
@@ -246,32 +253,75 @@ export class VaultService implements IVaultService {
     }
 
     try {
-      // Check if folder exists
-      const exists = await fsExists(absolutePath);
-      if (!exists) {
+      // Read the directory; a missing folder surfaces as ENOENT
+      return await fsReaddir(absolutePath);
+    } catch (error) {
+      if (error.code === 'ENOENT') {
         console.error(`Folder ${relativePath} does not exist`);
-        return undefined;
+      } else {
+        console.error(`Error listing files in ${relativePath}:`, error);
       }
-
-      // Read the directory
-      const files = await fsReaddir(absolutePath);
-      return files;
-    } catch (error) {
-      console.error(`Error listing files in ${relativePath}:`, error);
       return undefined;
     }
   }
 
-  async readAllMarkdownFiles(): Promise<Record<string, string>> {
+  /**
+   * Contents of every markdown file in the vault, keyed by relative path. A read is
+   * shared by callers until the vault changes, so the result must not be modified.
+   */
+  readAllMarkdownFiles(): Promise<Record<string, string>> {
+    const now = Date.now();
+    if (this.markdownFiles && this.markdownFiles.expiresAt > now) {
+      return this.markdownFiles.files;
+    }
+
+    const files = this.loadAllMarkdownFiles();
+    this.markdownFiles = { expiresAt: now + MARKDOWN_FILES_TTL_MS, files };
+    return files;
+  }
+
+  /**
+   * Drop the shared markdown read, for callers that write to the vault directly
+   */
+  invalidateMarkdownFiles(): void {
+    this.markdownFiles = null;
+  }
+
+  private async loadAllMarkdownFiles(): Promise<Record<string, string>> {
     const vaultRoot = this.getVaultRoot();
     if (!vaultRoot) {
       console.error('Vault root path is not configured');
       return {};
     }
 
-    const result: Record<string, string> = {};
-    await this.readMarkdownFilesRecursive(vaultRoot, '', result);
-    return result;
+    const filePaths: string[] = [];
+    await this.listMarkdownFilesRecursive(vaultRoot, '', filePaths);
+
+    // Overlap the reads, but keep a bounded number of files open at any time
+    const contents: (string | undefined)[] = new Array(filePaths.length);
+    let next = 0;
+    const readNext = async (): Promise<void> => {
+      while (next < filePaths.length) {
+        const i = next++;
+        try {
+          contents[i] = await fsReadFile(path.join(vaultRoot, filePaths[i]), 'utf8');
+        } catch (error) {
+          console.error(`Error reading markdown file ${filePaths[i]}:`, error);
+        }
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(MAX_CONCURRENT_READS, filePaths.length) }, readNext),
+    );
+
+    // Keyed in directory listing order, skipping files that could not be read
+    const files: Record<string, string> = {};
+    for (let i = 0; i < filePaths.length; i++) {
+      if (contents[i] !== undefined) {
+        files[filePaths[i]] = contents[i]!;
+      }
+    }
+    return files;
   }
 
   // Helper methods
@@ -284,10 +334,14 @@ export class VaultService implements IVaultService {
     }
   }
 
-  private async readMarkdownFilesRecursive(
+  /**
+   * Collect the relative paths of every markdown file under a directory, depth first in
+   * directory listing order. Only one directory is open at a time.
+   */
+  private async listMarkdownFilesRecursive(
     baseDir: string,
     relativePath: string,
-    result: Record<string, string>,
+    filePaths: string[],
   ): Promise<void> {
     const currentDir = path.join(baseDir, relativePath);
 
@@ -296,19 +350,12 @@ export class VaultService implements IVaultService {
 
       for (const entry of entries) {
         const entryRelativePath = path.join(relativePath, entry.name);
-        const entryAbsolutePath = path.join(baseDir, entryRelativePath);
 
         if (entry.isDirectory()) {
           // Recursively process subdirectories
-          await this.readMarkdownFilesRecursive(baseDir, entryRelativePath, result);
+          await this.listMarkdownFilesRecursive(baseDir, entryRelativePath, filePaths);
         } else if (entry.isFile() && entry.name.endsWith('.md')) {
-          // Read markdown files
-          try {
-            const content = await fsReadFile(entryAbsolutePath, 'utf8');
-            result[entryRelativePath] = content;
-          } catch (error) {
-            console.error(`Error reading markdown file ${entryRelativePath}:`, error);
-          }
+          filePaths.push(entryRelativePath);
         }
       }
     } catch (error) {
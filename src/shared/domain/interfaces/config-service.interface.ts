@@ -5,7 +5,8 @@ export interface IConfigService {
   getGeminiApiKey(): string | undefined;
   getGeminiModelName(): string;
   getTelegramBotToken(): string | undefined;
-  getTelegramUserIds(): string[];
+  getTelegramUserIds(): readonly string[];
+  getTelegramUserIdNumbers(): readonly number[];
   getObsidianVaultPath(): string | undefined;
   getObsidianDailyNotesFolder(): string | undefined;
 }
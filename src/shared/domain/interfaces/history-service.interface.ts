@@ -2,8 +2,10 @@ import { HistoryEntry } from '../models/history-entry.model';
 
 export interface IHistoryService {
   load(): void;
-  getHistory(): HistoryEntry[];
+  getHistory(): readonly HistoryEntry[];
+  getRecentHistory(limit: number): HistoryEntry[];
   appendEntry(entry: HistoryEntry): void;
   clearHistory(): void;
   setHistory(history: HistoryEntry[]): void;
+  flush(): Promise<void>;
 }
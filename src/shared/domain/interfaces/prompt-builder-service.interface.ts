@@ -9,5 +9,14 @@ export interface IPromptBuilderService {
    * @param vaultContext - Optional context from the vault files
    * @returns The complete system prompt as a string
    */
-  buildSystemPrompt(history: HistoryEntry[], vaultContext?: string): string;
+  buildSystemPrompt(history: readonly HistoryEntry[], vaultContext?: string): string;
+
+  /**
+   * Formats conversation history entries for inclusion in a prompt.
+   *
+   * @param history - The entries to format, oldest first
+   * @param maxContentLength - Optional limit on the text kept per entry
+   * @returns The formatted entries as a string
+   */
+  formatHistoryEntries(history: readonly HistoryEntry[], maxContentLength?: number): string;
 }
@@ -1,12 +1,39 @@
-import { Injectable } from '@nestjs/common';
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
 import { ConfigService as NestConfigService } from '@nestjs/config';
 import { IConfigService } from '../../domain/interfaces/config-service.interface';
 import * as path from 'path';
 
+// Settings the bot cannot work without; checked once at startup
+const REQUIRED_KEYS = [
+  'GEMINI_API_KEY',
+  'TELEGRAM_BOT_TOKEN',
+  'TELEGRAM_USER_IDS',
+  'OBSIDIAN_VAULT_PATH',
+] as const;
+
 @Injectable()
-export class ConfigService implements IConfigService {
+export class ConfigService implements IConfigService, OnModuleInit {
+  private readonly logger = new Logger(ConfigService.name);
+
+  // Configuration is immutable after startup, so derived values are computed once and frozen
+  private telegramUserIds?: readonly string[];
+  private telegramUserIdNumbers?: readonly number[];
+  private obsidianVaultPath?: string;
+  private geminiModelName?: string;
+  private tasksFolder?: string;
+
   constructor(private readonly configService: NestConfigService) {}
 
+  /**
+   * Report every missing required setting in a single warning
+   */
+  onModuleInit(): void {
+    const missing = REQUIRED_KEYS.filter((key) => !this.configService.get<string>(key));
+    if (missing.length > 0) {
+      this.logger.warn(`Missing configuration: ${missing.join(', ')}`);
+    }
+  }
+
   get<T>(key: string, defaultValue?: T): T {
     return this.configService.get<T>(key) ?? (defaultValue as T);
   }
@@ -26,25 +53,47 @@ export class ConfigService implements IConfigService {
   }
 
   getGeminiModelName(): string {
-    return this.getStr('GEMINI_MODEL_NAME', 'gemini-pro') as string;
+    if (this.geminiModelName === undefined) {
+      this.geminiModelName = this.getStr('GEMINI_MODEL_NAME', 'gemini-pro') as string;
+    }
+    return this.geminiModelName;
   }
 
   getTelegramBotToken(): string | undefined {
     return this.getStr('TELEGRAM_BOT_TOKEN');
   }
 
-  getTelegramUserIds(): string[] {
-    const userIdsStr = this.configService.get<string>('TELEGRAM_USER_IDS', '');
-    return userIdsStr
-      .split(',')
-      .map((id) => id.trim())
-      .filter(Boolean);
+  getTelegramUserIds(): readonly string[] {
+    if (!this.telegramUserIds) {
+      const userIdsStr = this.configService.get<string>('TELEGRAM_USER_IDS', '');
+      this.telegramUserIds = Object.freeze(
+        userIdsStr
+          .split(',')
+          .map((id) => id.trim())
+          .filter(Boolean),
+      );
+    }
+    return this.telegramUserIds;
+  }
+
+  getTelegramUserIdNumbers(): readonly number[] {
+    if (!this.telegramUserIdNumbers) {
+      this.telegramUserIdNumbers = Object.freeze(
+        this.getTelegramUserIds()
+          .map((id) => parseInt(id, 10))
+          .filter((id) => !isNaN(id)),
+      );
+    }
+    return this.telegramUserIdNumbers;
   }
 
   getObsidianVaultPath(): string {
-    const path = this.getStr('OBSIDIAN_VAULT_PATH')!;
-    // Remove any quotes that might be in the string
-    return path ? path.replace(/^["'](.*)["']$/, '$1') : '';
+    if (this.obsidianVaultPath === undefined) {
+      const path = this.getStr('OBSIDIAN_VAULT_PATH')!;
+      // Remove any quotes that might be in the string
+      this.obsidianVaultPath = path ? path.replace(/^["'](.*)["']$/, '$1') : '';
+    }
+    return this.obsidianVaultPath;
   }
 
   getObsidianDailyNotesFolder(): string | undefined {
@@ -56,6 +105,9 @@ export class ConfigService implements IConfigService {
   }
 
   getTasksFolder(): string {
-    return this.getStr('TASKS_FOLDER', '03 - Tasks')!;
+    if (this.tasksFolder === undefined) {
+      this.tasksFolder = this.getStr('TASKS_FOLDER', '03 - Tasks')!;
+    }
+    return this.tasksFolder;
   }
 }
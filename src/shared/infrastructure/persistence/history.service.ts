@@ -1,59 +1,184 @@
-import { Injectable } from '@nestjs/common';
+import { Injectable, OnModuleDestroy } from '@nestjs/common';
 import { IHistoryService } from '../../domain/interfaces/history-service.interface';
 import { HistoryEntry } from '../../domain/models/history-entry.model';
 import * as fs from 'fs';
+import { FileHandle, open } from 'fs/promises';
 import * as path from 'path';
 
+// Appends within this window are written to disk together
+const SAVE_DEBOUNCE_MS = 250;
+// The file ends with this after every write, so new entries are written over it
+const FILE_TAIL = '\n]\n';
+
 @Injectable()
-export class HistoryService implements IHistoryService {
+export class HistoryService implements IHistoryService, OnModuleDestroy {
   private history: HistoryEntry[] = [];
+  // JSON of each entry, serialized once when it is added rather than on every save
+  private serializedEntries: string[] = [];
+  // Copy handed out by getHistory, shared until the history changes
+  private snapshot: readonly HistoryEntry[] | null = null;
   private readonly historyFilePath: string = path.join(process.cwd(), 'conversation_history.json');
   private isLoaded = false;
+  private saveTimer: NodeJS.Timeout | null = null;
+  private file: FileHandle | null = null;
+  // What the file holds: the first `writtenEntries` entries in `fileSize` bytes.
+  // Until the first full rewrite its layout is unknown, so nothing can be appended.
+  private needsRewrite = true;
+  private writtenEntries = 0;
+  private fileSize = 0;
+  // Saves run one after another off the caller's path, each writing the state it was given
+  private pendingWrites: Promise<void> = Promise.resolve();
 
   load(): void {
     if (this.isLoaded) return;
 
     try {
-      if (fs.existsSync(this.historyFilePath)) {
-        const fileContent = fs.readFileSync(this.historyFilePath, 'utf8');
-        this.history = JSON.parse(fileContent);
-      } else {
-        this.history = [];
+      // One stat answers both whether the file exists and whether there is anything to parse
+      const stats = fs.statSync(this.historyFilePath, { throwIfNoEntry: false });
+      if (!stats) {
+        this.replaceEntries([]);
         this.saveHistory();
+      } else if (stats.size === 0) {
+        this.replaceEntries([]);
+      } else {
+        const fileContent = fs.readFileSync(this.historyFilePath, 'utf8');
+        this.replaceEntries(JSON.parse(fileContent));
       }
-      this.isLoaded = true;
     } catch (error) {
       console.error('Error loading history:', error);
-      this.history = [];
+      this.replaceEntries([]);
+    } finally {
+      // Mark as loaded even on failure so a corrupt file is parsed and reported only once
+      this.isLoaded = true;
     }
   }
 
-  getHistory(): HistoryEntry[] {
+  getHistory(): readonly HistoryEntry[] {
     if (!this.isLoaded) this.load();
-    return [...this.history];
+    if (!this.snapshot) {
+      this.snapshot = [...this.history];
+    }
+    return this.snapshot;
+  }
+
+  /**
+   * The last `limit` entries, copied without going through the full snapshot
+   */
+  getRecentHistory(limit: number): HistoryEntry[] {
+    if (!this.isLoaded) this.load();
+    return limit > 0 ? this.history.slice(-limit) : [];
   }
 
   appendEntry(entry: HistoryEntry): void {
     if (!this.isLoaded) this.load();
     this.history.push(entry);
-    this.saveHistory();
+    this.serializedEntries.push(JSON.stringify(entry));
+    this.snapshot = null;
+    this.scheduleSave();
   }
 
   clearHistory(): void {
-    this.history = [];
+    this.replaceEntries([]);
     this.saveHistory();
   }
 
   setHistory(history: HistoryEntry[]): void {
-    this.history = [...history];
+    this.replaceEntries([...history]);
     this.saveHistory();
   }
 
+  /**
+   * Write any appended entries that are still waiting for the debounce timer,
+   * resolving once every save so far has reached the file
+   */
+  flush(): Promise<void> {
+    if (this.saveTimer) {
+      this.saveHistory();
+    }
+    return this.pendingWrites;
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    await this.flush();
+    await this.closeFile();
+  }
+
+  private replaceEntries(history: HistoryEntry[]): void {
+    this.history = history;
+    this.serializedEntries = history.map((entry) => JSON.stringify(entry));
+    this.snapshot = null;
+    this.needsRewrite = true;
+  }
+
+  private scheduleSave(): void {
+    if (this.saveTimer) return;
+    this.saveTimer = setTimeout(() => this.saveHistory(), SAVE_DEBOUNCE_MS);
+  }
+
   private saveHistory(): void {
+    if (this.saveTimer) {
+      clearTimeout(this.saveTimer);
+      this.saveTimer = null;
+    }
+
+    this.pendingWrites = this.pendingWrites.then(() => this.writeHistoryFile());
+  }
+
+  /**
+   * Bring the file up to date with the entries in memory. New entries are appended
+   * over the closing bracket, so a save costs the size of what changed; clearing or
+   * replacing the history, or a failed write, rewrites the whole file once.
+   */
+  private async writeHistoryFile(): Promise<void> {
+    const entries = this.serializedEntries;
+    const total = entries.length;
+    const rewrite = this.needsRewrite || this.writtenEntries === 0;
+    if (!rewrite && total === this.writtenEntries) return;
+    this.needsRewrite = false;
+
     try {
-      fs.writeFileSync(this.historyFilePath, JSON.stringify(this.history, null, 2), 'utf8');
+      const file = await this.getFile();
+      if (rewrite) {
+        // One entry per line, joined into a single string for a single write
+        const content = total > 0 ? `[\n${entries.join(',\n')}${FILE_TAIL}` : '[]\n';
+
+        // Overwrite in place and cut off the old tail, reusing the open handle
+        const { bytesWritten } = await file.write(content, 0, 'utf8');
+        await file.truncate(bytesWritten);
+        this.fileSize = bytesWritten;
+      } else {
+        const content = `,\n${entries.slice(this.writtenEntries, total).join(',\n')}${FILE_TAIL}`;
+        const position = this.fileSize - FILE_TAIL.length;
+        const { bytesWritten } = await file.write(content, position, 'utf8');
+        this.fileSize = position + bytesWritten;
+      }
+      this.writtenEntries = total;
     } catch (error) {
       console.error('Error saving history:', error);
+      this.needsRewrite = true;
+      await this.closeFile();
+    }
+  }
+
+  /**
+   * The history file, opened once for reading and writing and created if missing.
+   * Writing in place keeps the file's inode, so a bind-mounted file stays in sync.
+   */
+  private async getFile(): Promise<FileHandle> {
+    if (!this.file) {
+      this.file = await open(this.historyFilePath, fs.constants.O_RDWR | fs.constants.O_CREAT);
+    }
+    return this.file;
+  }
+
+  private async closeFile(): Promise<void> {
+    if (!this.file) return;
+    const file = this.file;
+    this.file = null;
+    try {
+      await file.close();
+    } catch (error) {
+      console.error('Error closing history file:', error);
     }
   }
 }
@@ -3,10 +3,19 @@ import { IPromptBuilderService } from '../../domain/interfaces/prompt-builder-se
 import { HistoryEntry } from '../../domain/models/history-entry.model';
 import { ToolsRegistryService } from '../../../modules/tools/application/services/tools-registry.service';
 
+// Conversation entries included in the system prompt
+export const PROMPT_HISTORY_LIMIT = 10;
+
 @Injectable()
 export class PromptBuilderService implements IPromptBuilderService {
   private readonly logger = new Logger(PromptBuilderService.name);
   private toolDefsCache: any[] = [];
+  // Tool definitions don't change after startup, so their prompt text is built once
+  private toolDescriptions: string | null = null;
+  private staticPrompt: string | null = null;
+  // History entries never change, so each one's display text is derived once
+  // instead of re-parsing assistant tool-call JSON for every prompt
+  private readonly entryDisplayText = new WeakMap<HistoryEntry, string>();
 
   constructor(@Optional() private readonly toolsRegistry?: ToolsRegistryService) {
     this.logger.debug('PromptBuilderService initialized.');
@@ -26,6 +35,10 @@ export class PromptBuilderService implements IPromptBuilderService {
   }
 
   private formatToolDescriptions(): string {
+    if (this.toolDescriptions) {
+      return this.toolDescriptions;
+    }
+
     if (!this.toolDefsCache || this.toolDefsCache.length === 0) {
       if (this.toolsRegistry) {
         this.logger.warn(
@@ -56,13 +69,13 @@ export class PromptBuilderService implements IPromptBuilderService {
       descriptionLines.push(`- ${name}: ${description}`);
 
       const paramDetails: string[] = [];
-      const requiredParams = tool.required || [];
+      const requiredParams = new Set<string>(tool.required || []);
       const parameters = tool.parameters;
 
       // Check if parameters is an object and not empty
       if (parameters && typeof parameters === 'object' && Object.keys(parameters).length > 0) {
         for (const key of Object.keys(parameters.properties || {})) {
-          const status = requiredParams.includes(key) ? 'required' : 'optional';
+          const status = requiredParams.has(key) ? 'required' : 'optional';
           paramDetails.push(`${key} (${status})`);
         }
       }
@@ -76,7 +89,8 @@ export class PromptBuilderService implements IPromptBuilderService {
     }
 
     // Use '\n' for proper line breaks in the final prompt
-    return descriptionLines.join('\n');
+    this.toolDescriptions = descriptionLines.join('\n');
+    return this.toolDescriptions;
   }
 
   private getTaskTemplate(): string {
@@ -217,7 +231,15 @@ Example 2: User asks "Add a task to call mom tomorrow"
   - ALWAYS put task files in the "03 - Tasks" folder, never in the root directory`;
   }
 
-  public buildSystemPrompt(history: HistoryEntry[], vaultContext?: string): string {
+  /**
+   * The part of the system prompt that is the same for every request: intro, tools,
+   * task template and output format. Built once the tool descriptions are available
+   */
+  private getStaticPrompt(): string {
+    if (this.staticPrompt) {
+      return this.staticPrompt;
+    }
+
     // Get prompt components
     const toolDescriptions = this.formatToolDescriptions();
     const taskTemplate = this.getTaskTemplate();
@@ -225,43 +247,9 @@ Example 2: User asks "Add a task to call mom tomorrow"
     const toolExample = this.getToolCallExample();
     const instructions = this.getInstructions();
 
-    // Get current date and time
-    const currentDatetimeStr = new Date().toLocaleString();
-
-    // Form prompt lines
-    const promptLines = [
+    const staticPrompt = [
       'You are an AI assistant designed to manage files within an Obsidian vault.',
       'Your primary functions are file and folder manipulation (create, delete, modify) based on user requests, including managing tasks and daily notes.',
-      `\nThe current date and time is: ${currentDatetimeStr}`,
-    ];
-
-    // Format conversation history if available
-    if (history && history.length > 0) {
-      const formattedHistory = this.formatConversationHistory(history);
-      if (formattedHistory) {
-        promptLines.push(
-          '\nHere is your conversation history with the user:',
-          '--- CONVERSATION HISTORY START ---',
-          formattedHistory,
-          '--- CONVERSATION HISTORY END ---\n',
-        );
-      }
-    }
-
-    // Add vault context if available
-    if (vaultContext) {
-      promptLines.push(
-        '\nCurrent content of relevant files from the Obsidian vault is provided below. Refer to this content when needed.',
-      );
-      promptLines.push('--- VAULT CONTEXT START ---');
-      promptLines.push(vaultContext);
-      promptLines.push('--- VAULT CONTEXT END ---\n');
-    } else {
-      promptLines.push('\nNo specific vault file context provided for this request.');
-    }
-
-    // Add remaining parts
-    promptLines.push(
       'Available Tools:',
       toolDescriptions,
       '\nTask Creation Template:',
@@ -278,7 +266,49 @@ Example 2: User asks "Add a task to call mom tomorrow"
       '\nFORMATTING REQUIREMENT:',
       'Your entire response must be ONLY a valid JSON array. No text before or after the JSON array. No markdown code block markers. Just the raw JSON array.',
       '\nREMINDER: When a user asks to add/create a task, ALWAYS create the file in the "03 - Tasks" folder with the format "03 - Tasks/YYYY-MM-DD Task Name.md".',
-    );
+    ].join('\n\n');
+
+    // Without tool descriptions the prompt carries a placeholder, so keep retrying
+    if (this.toolDescriptions) {
+      this.staticPrompt = staticPrompt;
+    }
+    return staticPrompt;
+  }
+
+  public buildSystemPrompt(history: readonly HistoryEntry[], vaultContext?: string): string {
+    // Form prompt lines. The parts that never change come first, then the vault context,
+    // then history and the clock, so consecutive requests share the longest possible
+    // prefix and Gemini's implicit context caching can reuse it
+    const promptLines = [this.getStaticPrompt()];
+
+    // Add vault context if available
+    if (vaultContext) {
+      promptLines.push(
+        '\nCurrent content of relevant files from the Obsidian vault is provided below. Refer to this content when needed.',
+      );
+      promptLines.push('--- VAULT CONTEXT START ---');
+      promptLines.push(vaultContext);
+      promptLines.push('--- VAULT CONTEXT END ---\n');
+    } else {
+      promptLines.push('\nNo specific vault file context provided for this request.');
+    }
+
+    // Format conversation history if available
+    if (history && history.length > 0) {
+      const formattedHistory = this.formatConversationHistory(history);
+      if (formattedHistory) {
+        promptLines.push(
+          '\nHere is your conversation history with the user:',
+          '--- CONVERSATION HISTORY START ---',
+          formattedHistory,
+          '--- CONVERSATION HISTORY END ---\n',
+        );
+      }
+    }
+
+    // Get current date and time
+    const currentDatetimeStr = new Date().toLocaleString();
+    promptLines.push(`\nThe current date and time is: ${currentDatetimeStr}`);
 
     // Build final prompt
     const systemPrompt = promptLines.join('\n\n'); // Use double line breaks for better readability
@@ -292,45 +322,72 @@ Example 2: User asks "Add a task to call mom tomorrow"
    * @param history - Array of history entries
    * @returns Formatted conversation history string
    */
-  private formatConversationHistory(history: HistoryEntry[]): string {
+  private formatConversationHistory(history: readonly HistoryEntry[]): string {
     if (!history || history.length === 0) {
       return '';
     }
 
-    // Limit history to last 10 messages to avoid context length issues
-    const recentHistory = history.slice(-10);
+    // Limit history to the last few messages to avoid context length issues
+    return this.formatHistoryEntries(history.slice(-PROMPT_HISTORY_LIMIT));
+  }
 
-    return recentHistory
+  /**
+   * Format history entries as `[time] Role: text` blocks, optionally cutting each
+   * entry's text to `maxContentLength` characters
+   *
+   * @param history - The entries to format, oldest first
+   * @param maxContentLength - Longest text kept per entry before appending '...'
+   * @returns The formatted entries separated by blank lines
+   */
+  formatHistoryEntries(history: readonly HistoryEntry[], maxContentLength = Infinity): string {
+    return history
       .map((entry) => {
         const timestamp = entry.timestamp ? new Date(entry.timestamp).toLocaleTimeString() : '';
         const role = entry.role === 'user' ? 'User' : 'Assistant';
+        const content = this.getEntryDisplayText(entry);
+        const text =
+          content.length > maxContentLength
+            ? `${content.substring(0, maxContentLength)}...`
+            : content;
+        return `[${timestamp}] ${role}: ${text}`;
+      })
+      .join('\n\n');
+  }
+
+  /**
+   * The text shown for a history entry: assistant tool calls are reduced to their
+   * replies, or to a summary of the operations when there are none
+   */
+  private getEntryDisplayText(entry: HistoryEntry): string {
+    const cached = this.entryDisplayText.get(entry);
+    if (cached !== undefined) {
+      return cached;
+    }
 
-        // For assistant entries that contain JSON tool calls, format them nicely
-        let content = entry.content;
-        if (
-          role === 'Assistant' &&
-          content.trim().startsWith('[') &&
-          content.trim().endsWith(']')
-        ) {
-          try {
-            const toolCalls = JSON.parse(content);
-            if (Array.isArray(toolCalls)) {
-              // Find reply tool calls to show in history
-              const replyTools = toolCalls.filter((tool) => tool.tool === 'reply');
-              if (replyTools.length > 0) {
-                content = replyTools.map((tool) => tool.params?.message || '').join('\n');
-              } else {
-                // If no reply tools, summarize the actions
-                content = `[Performed ${toolCalls.length} operations: ${toolCalls.map((t) => t.tool).join(', ')}]`;
-              }
-            }
-          } catch (e) {
-            // If parsing fails, use the original content
+    let content = entry.content;
+    const trimmed = content.trim();
+    if (entry.role === 'assistant' && trimmed.startsWith('[') && trimmed.endsWith(']')) {
+      try {
+        const toolCalls = JSON.parse(content);
+        if (Array.isArray(toolCalls)) {
+          // Find reply tool calls to show in history
+          const replies: string[] = [];
+          for (const tool of toolCalls) {
+            if (tool.tool === 'reply') replies.push(tool.params?.message || '');
+          }
+          if (replies.length > 0) {
+            content = replies.join('\n');
+          } else {
+            // If no reply tools, summarize the actions
+            content = `[Performed ${toolCalls.length} operations: ${toolCalls.map((t) => t.tool).join(', ')}]`;
           }
         }
+      } catch (e) {
+        // If parsing fails, use the original content
+      }
+    }
 
-        return `[${timestamp}] ${role}: ${content}`;
-      })
-      .join('\n\n');
+    this.entryDisplayText.set(entry, content);
+    return content;
   }
 }
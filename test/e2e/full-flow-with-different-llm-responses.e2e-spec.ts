@@ -20,6 +20,7 @@ interface MockVaultService extends Partial<IVaultService> {
   createFile: jest.Mock;
   modifyFile: jest.Mock;
   deleteFile: jest.Mock;
+  invalidateMarkdownFiles: jest.Mock;
 }
 
 describe('Full Flow with Different LLM Responses (e2e)', () => {
@@ -50,6 +51,7 @@ describe('Full Flow with Different LLM Responses (e2e)', () => {
       createFile: jest.fn().mockResolvedValue(true),
       modifyFile: jest.fn().mockResolvedValue(true),
       deleteFile: jest.fn().mockResolvedValue(true),
+      invalidateMarkdownFiles: jest.fn(),
     };
 
     // Mock tool handlers
@@ -19,6 +19,7 @@ interface MockVaultService extends Partial<IVaultService> {
   createFile: jest.Mock;
   modifyFile: jest.Mock;
   deleteFile: jest.Mock;
+  invalidateMarkdownFiles: jest.Mock;
 }
 
 describe('Full Flow with Tool Execution (e2e)', () => {
@@ -54,6 +55,7 @@ describe('Full Flow with Tool Execution (e2e)', () => {
       deleteFile: jest.fn().mockImplementation(async (fileName) => {
         return { success: true };
       }),
+      invalidateMarkdownFiles: jest.fn(),
     };
 
     // Mock tool handlers
@@ -0,0 +1,139 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { HistoryService } from '../../src/shared/infrastructure/persistence/history.service';
+import { HistoryEntry } from '../../src/shared/domain/models/history-entry.model';
+
+describe('HistoryService', () => {
+  let tempDir: string;
+  let historyFilePath: string;
+  let service: HistoryService;
+
+  const entry = (content: string): HistoryEntry => ({
+    role: 'user',
+    content,
+    timestamp: new Date('2024-01-01T10:00:00Z'),
+  });
+
+  // The file must stay valid JSON after every write
+  const readFile = (): HistoryEntry[] => JSON.parse(fs.readFileSync(historyFilePath, 'utf8'));
+  const contents = (): string[] => readFile().map((saved) => saved.content);
+
+  beforeEach(() => {
+    // The service keeps its file in the working directory
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'history-service-'));
+    historyFilePath = path.join(tempDir, 'conversation_history.json');
+    jest.spyOn(process, 'cwd').mockReturnValue(tempDir);
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    service = new HistoryService();
+  });
+
+  afterEach(async () => {
+    await service.onModuleDestroy();
+    jest.restoreAllMocks();
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('should write debounced appends together', async () => {
+    // Act
+    service.appendEntry(entry('first'));
+    service.appendEntry(entry('second'));
+    service.appendEntry(entry('third'));
+    await service.flush();
+
+    // Assert
+    expect(contents()).toEqual(['first', 'second', 'third']);
+  });
+
+  it('should keep the file valid across several rounds of appends', async () => {
+    // Act & Assert
+    service.appendEntry(entry('first'));
+    await service.flush();
+    expect(contents()).toEqual(['first']);
+
+    service.appendEntry(entry('second'));
+    service.appendEntry(entry('third'));
+    await service.flush();
+    expect(contents()).toEqual(['first', 'second', 'third']);
+
+    service.appendEntry(entry('fourth'));
+    await service.flush();
+    expect(contents()).toEqual(['first', 'second', 'third', 'fourth']);
+  });
+
+  it('should write appended entries once the debounce timer fires', async () => {
+    // Arrange
+    jest.useFakeTimers();
+
+    try {
+      // Act
+      service.appendEntry(entry('first'));
+      service.appendEntry(entry('second'));
+      jest.runOnlyPendingTimers();
+    } finally {
+      jest.useRealTimers();
+    }
+    await service.flush();
+
+    // Assert
+    expect(contents()).toEqual(['first', 'second']);
+  });
+
+  it('should rewrite the file when the history is cleared and appended to again', async () => {
+    // Arrange
+    service.appendEntry(entry('first'));
+    service.appendEntry(entry('second'));
+    service.appendEntry(entry('a much longer third entry that leaves bytes behind'));
+    await service.flush();
+
+    // Act
+    service.clearHistory();
+    await service.flush();
+    expect(readFile()).toEqual([]);
+
+    service.appendEntry(entry('after clear'));
+    service.appendEntry(entry('and another'));
+    await service.flush();
+
+    // Assert
+    expect(contents()).toEqual(['after clear', 'and another']);
+  });
+
+  it('should rewrite the whole file after a failed write', async () => {
+    // Arrange
+    service.appendEntry(entry('first'));
+    await service.flush();
+    jest.spyOn(service as any, 'getFile').mockRejectedValueOnce(new Error('disk full'));
+
+    // Act
+    service.appendEntry(entry('lost write'));
+    await service.flush();
+    expect(contents()).toEqual(['first']);
+
+    service.appendEntry(entry('after failure'));
+    await service.flush();
+
+    // Assert
+    expect(contents()).toEqual(['first', 'lost write', 'after failure']);
+    expect(console.error).toHaveBeenCalledWith('Error saving history:', expect.any(Error));
+  });
+
+  it('should load the entries written by a previous instance', async () => {
+    // Arrange
+    service.appendEntry(entry('first'));
+    await service.flush();
+    service.appendEntry(entry('second'));
+    await service.onModuleDestroy();
+
+    // Act
+    const reloaded = new HistoryService();
+    const history = reloaded.getHistory();
+    reloaded.appendEntry(entry('third'));
+    await reloaded.onModuleDestroy();
+
+    // Assert
+    expect(history.map((saved) => saved.content)).toEqual(['first', 'second']);
+    expect(contents()).toEqual(['first', 'second', 'third']);
+  });
+});
@@ -1,13 +1,49 @@
 import { Test, TestingModule } from '@nestjs/testing';
-import { ConfigService } from '@nestjs/config';
+import { ConfigService } from '../../src/shared/infrastructure/config/config.service';
 import { LlmProcessorService } from '../../src/modules/llm/application/services/llm-processor.service';
 import { ToolsRegistryService } from '../../src/modules/tools/application/services/tools-registry.service';
 import { GoogleGenaiAdapter } from '../../src/modules/llm/infrastructure/adapters/google-genai.adapter';
+import { PromptBuilderService } from '../../src/shared/infrastructure/services/prompt-builder.service';
+import { HistoryService } from '../../src/shared/infrastructure/persistence/history.service';
 
 describe('LlmProcessorService', () => {
   let service: LlmProcessorService;
   let mockToolsRegistry: Partial<ToolsRegistryService>;
   let mockGoogleGenaiAdapter: Partial<GoogleGenaiAdapter>;
+  let mockPromptBuilder: Partial<PromptBuilderService>;
+  let mockHistoryService: Partial<HistoryService>;
+
+  const toolDefinitions = [
+    {
+      name: 'create_file',
+      description: 'Creates a new file with the specified content',
+      required: ['file_path', 'content'],
+      parameters: {
+        properties: {
+          file_path: { type: 'string', description: 'Path to the file to create' },
+          content: { type: 'string', description: 'Content to write to the file' },
+        },
+      },
+    },
+    {
+      name: 'reply',
+      description: 'Sends a message to the user',
+      required: ['message'],
+      parameters: {
+        properties: {
+          message: { type: 'string', description: 'Message to send to the user' },
+        },
+      },
+    },
+    {
+      name: 'finish',
+      description: 'Ends the conversation',
+      required: [],
+      parameters: {
+        properties: {},
+      },
+    },
+  ];
 
   beforeEach(async () => {
     // Reset mocks
@@ -15,7 +51,10 @@ describe('LlmProcessorService', () => {
 
     // Setup mock for tools registry
     mockToolsRegistry = {
-      getAvailableTools: jest.fn().mockReturnValue(['create_file', 'modify_file', 'delete_file']),
+      getToolDefinitions: jest.fn().mockReturnValue(toolDefinitions),
+      hasToolHandler: jest
+        .fn()
+        .mockImplementation((tool) => toolDefinitions.some(({ name }) => name === tool)),
       executeTool: jest.fn(),
     };
 
@@ -24,6 +63,15 @@ describe('LlmProcessorService', () => {
       generateContent: jest.fn(),
     };
 
+    // Setup mocks for the prompt and the conversation history
+    mockPromptBuilder = {
+      buildSystemPrompt: jest.fn().mockReturnValue('system prompt'),
+    };
+    mockHistoryService = {
+      getRecentHistory: jest.fn().mockReturnValue([]),
+      appendEntry: jest.fn(),
+    };
+
     // Setup mock for config service
     const mockConfigService = {
       get: jest.fn().mockImplementation((key) => {
@@ -47,13 +95,21 @@ describe('LlmProcessorService', () => {
           provide: GoogleGenaiAdapter,
           useValue: mockGoogleGenaiAdapter,
         },
+        {
+          provide: PromptBuilderService,
+          useValue: mockPromptBuilder,
+        },
+        {
+          provide: HistoryService,
+          useValue: mockHistoryService,
+        },
       ],
     }).compile();
 
     service = module.get<LlmProcessorService>(LlmProcessorService);
   });
 
-  it('should process a message and return plain text response', async () => {
+  it('should turn a plain text response into a reply tool call', async () => {
     // Arrange
     const userId = 123;
     const message = 'Hello, how are you?';
@@ -69,7 +125,7 @@ describe('LlmProcessorService', () => {
     // Assert
     expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalled();
     expect(result).toEqual({
-      text: expectedResponse,
+      toolCalls: [{ tool: 'reply', params: { message: expectedResponse } }],
     });
   });
 
@@ -78,36 +134,114 @@ describe('LlmProcessorService', () => {
     const userId = 123;
     const message = 'What files do I have?';
     const vaultContext = 'File: notes.md\n\n```\n# Notes\nThis is a note.\n```\n\n';
-    const expectedResponse =
-      'You have a notes.md file with a heading "Notes" and content "This is a note."';
 
     (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
-      text: expectedResponse,
+      text: JSON.stringify([{ tool: 'reply', data: { message: 'You have notes.md' } }]),
     });
 
     // Act
-    const result = await service.processUserMessage(message, userId, vaultContext);
+    await service.processUserMessage(message, userId, vaultContext);
 
     // Assert
+    expect(mockPromptBuilder.buildSystemPrompt).toHaveBeenCalledWith([], vaultContext);
     expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalledWith(
-      expect.arrayContaining([
-        expect.objectContaining({
-          text: expect.stringContaining('Context from vault:'),
-        }),
-      ]),
+      [{ text: message }],
+      'system prompt',
+      undefined,
+      undefined,
+      expect.any(Object),
     );
-    expect(result).toEqual({
-      text: expectedResponse,
+  });
+
+  it('should request a flat response schema covering every tool', async () => {
+    // Arrange
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
+      text: JSON.stringify([{ tool: 'finish', data: {} }]),
+    });
+
+    // Act
+    await service.processUserMessage('Thanks', 123);
+
+    // Assert
+    const schema = (mockGoogleGenaiAdapter.generateContent as jest.Mock).mock.calls[0][4];
+    expect(schema).toEqual({
+      type: 'ARRAY',
+      items: {
+        type: 'OBJECT',
+        properties: {
+          tool: { type: 'STRING', enum: ['create_file', 'reply', 'finish'] },
+          data: {
+            type: 'OBJECT',
+            properties: {
+              file_path: { type: 'STRING', description: 'Path to the file to create' },
+              content: { type: 'STRING', description: 'Content to write to the file' },
+              message: { type: 'STRING', description: 'Message to send to the user' },
+            },
+          },
+        },
+        required: ['tool', 'data'],
+      },
     });
   });
 
+  it('should extract tool calls from a fenced JSON block', async () => {
+    // Arrange
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
+      text: '```json\n[{"tool": "reply", "data": {"message": "Fenced"}}]\n```',
+    });
+
+    // Act
+    const result = await service.processUserMessage('Hello', 123);
+
+    // Assert
+    expect(result.toolCalls).toEqual([{ tool: 'reply', params: { message: 'Fenced' } }]);
+  });
+
+  it('should extract a tool call array embedded in text', async () => {
+    // Arrange
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
+      text:
+        'Sure [see below]. [{"tool": "reply", "data": {"message": "Embedded"}}] ' +
+        'Let me know [if needed]',
+    });
+
+    // Act
+    const result = await service.processUserMessage('Hello', 123);
+
+    // Assert
+    expect(result.toolCalls).toEqual([{ tool: 'reply', params: { message: 'Embedded' } }]);
+  });
+
+  it('should extract tool calls in the [[tool:name]] format', async () => {
+    // Arrange
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
+      text:
+        'Creating it now. [[tool:create_file]]' +
+        '{"file_path": "todo.md", "content": "# Todo"}[[/tool]]',
+    });
+
+    // Act
+    const result = await service.processUserMessage('Create todo.md', 123);
+
+    // Assert
+    expect(result.toolCalls).toEqual([
+      { tool: 'create_file', params: { file_path: 'todo.md', content: '# Todo' } },
+    ]);
+  });
+
   it('should detect and extract tool calls from LLM response', async () => {
     // Arrange
     const userId = 123;
     const message = 'Create a new file called todo.md';
-    const responseWithToolCall = `I'll create that file for you.
-
-[[tool:create_file]]{"fileName":"todo.md","content":"# Todo List\\n\\n- [ ] First task\\n- [ ] Second task"}[[/tool]]`;
+    const responseWithToolCall = JSON.stringify([
+      {
+        tool: 'create_file',
+        data: {
+          file_path: 'todo.md',
+          content: '# Todo List\n\n- [ ] First task\n- [ ] Second task',
+        },
+      },
+    ]);
 
     (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
       text: responseWithToolCall,
@@ -118,25 +252,26 @@ describe('LlmProcessorService', () => {
 
     // Assert
     expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalled();
-    expect(result).toHaveProperty('toolCalls');
-    expect(result.toolCalls?.length).toBe(1);
-    expect(result.toolCalls?.[0]).toEqual({
-      tool: 'create_file',
-      params: {
-        fileName: 'todo.md',
-        content: '# Todo List\n\n- [ ] First task\n- [ ] Second task',
+    expect(result.toolCalls).toEqual([
+      {
+        tool: 'create_file',
+        params: {
+          file_path: 'todo.md',
+          content: '# Todo List\n\n- [ ] First task\n- [ ] Second task',
+        },
       },
-    });
+    ]);
   });
 
   it('should handle multiple tool calls in a single response', async () => {
     // Arrange
     const userId = 123;
     const message = 'Create two files: todo.md and notes.md';
-    const responseWithMultipleToolCalls = `I'll create those files for you.
-
-[[tool:create_file]]{"fileName":"todo.md","content":"# Todo List\\n\\n- [ ] Task 1"}[[/tool]]
-[[tool:create_file]]{"fileName":"notes.md","content":"# Notes\\n\\nImportant notes here."}[[/tool]]`;
+    const responseWithMultipleToolCalls = JSON.stringify([
+      { tool: 'create_file', data: { file_path: 'todo.md', content: '# Todo List' } },
+      { tool: 'create_file', data: { file_path: 'notes.md', content: '# Notes' } },
+      { tool: 'finish' },
+    ]);
 
     (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
       text: responseWithMultipleToolCalls,
@@ -146,74 +281,75 @@ describe('LlmProcessorService', () => {
     const result = await service.processUserMessage(message, userId);
 
     // Assert
-    expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalled();
-    expect(result).toHaveProperty('toolCalls');
-    expect(result.toolCalls?.length).toBe(2);
-
-    if (result.toolCalls && result.toolCalls.length >= 2) {
-      expect(result.toolCalls[0].tool).toBe('create_file');
-      expect(result.toolCalls[1].tool).toBe('create_file');
-      expect(result.toolCalls[0].params.fileName).toBe('todo.md');
-      expect(result.toolCalls[1].params.fileName).toBe('notes.md');
-    }
+    expect(result.toolCalls).toHaveLength(3);
+    expect(result.toolCalls[0].params.file_path).toBe('todo.md');
+    expect(result.toolCalls[1].params.file_path).toBe('notes.md');
+    expect(result.toolCalls[2]).toEqual({ tool: 'finish', params: {} });
   });
 
-  it('should handle errors from the LLM API', async () => {
+  it('should drop tool calls that miss required params', async () => {
     // Arrange
-    const userId = 123;
-    const message = 'Hello';
-    const errorMessage = 'API quota exceeded';
-
-    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockRejectedValue(
-      new Error(errorMessage),
-    );
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
+      text: JSON.stringify([
+        { tool: 'create_file', data: { file_path: 'empty.md' } },
+        { tool: 'reply', data: { message: 'Done' } },
+      ]),
+    });
 
     // Act
-    const result = await service.processUserMessage(message, userId);
+    const result = await service.processUserMessage('Create empty.md', 123);
 
     // Assert
-    expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalled();
-    expect(result).toEqual({
-      error: errorMessage,
+    expect(result.toolCalls).toEqual([{ tool: 'reply', params: { message: 'Done' } }]);
+  });
+
+  it('should reply with an error when every tool call is invalid', async () => {
+    // Arrange
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
+      text: JSON.stringify([{ tool: 'reply', data: {} }]),
     });
+
+    // Act
+    const result = await service.processUserMessage('Hello', 123);
+
+    // Assert
+    expect(result.toolCalls).toHaveLength(1);
+    expect(result.toolCalls[0].tool).toBe('reply');
+    expect(result.toolCalls[0].params.message).toContain('I encountered an issue');
   });
 
-  it('should handle null response from the adapter', async () => {
+  it('should handle errors from the LLM API', async () => {
     // Arrange
     const userId = 123;
     const message = 'Hello';
+    const errorMessage = 'API quota exceeded';
 
-    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue(null);
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockRejectedValue(
+      new Error(errorMessage),
+    );
 
     // Act
     const result = await service.processUserMessage(message, userId);
 
     // Assert
     expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalled();
-    expect(result).toEqual({
-      error: 'Failed to generate content from LLM',
-    });
+    expect(result.error).toBe(errorMessage);
+    expect(result.toolCalls[0].tool).toBe('reply');
   });
 
-  it('should handle malformed tool call JSON in response', async () => {
+  it('should handle null response from the adapter', async () => {
     // Arrange
     const userId = 123;
-    const message = 'Create a file with invalid JSON';
-    const responseWithInvalidToolCall = `I'll try to create that file.
-
-[[tool:create_file]]{"fileName":"invalid.md","content: "Missing quote}[[/tool]]`;
+    const message = 'Hello';
 
-    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue({
-      text: responseWithInvalidToolCall,
-    });
+    (mockGoogleGenaiAdapter.generateContent as jest.Mock).mockResolvedValue(null);
 
     // Act
     const result = await service.processUserMessage(message, userId);
 
     // Assert
     expect(mockGoogleGenaiAdapter.generateContent).toHaveBeenCalled();
-    expect(result).toHaveProperty('text');
-    // expect(result.text).toBe(responseWithInvalidToolCall);
-    expect(result).not.toHaveProperty('toolCalls');
+    expect(result.error).toBe('Failed to generate content from LLM');
+    expect(result.toolCalls[0].tool).toBe('reply');
   });
 });
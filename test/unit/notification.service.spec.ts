@@ -0,0 +1,238 @@
+import { EventEmitter } from 'events';
+import { NotificationService } from '../../src/modules/notifications/infrastructure/services/notification.service';
+import {
+  Task,
+  TaskPriority,
+  TaskStatus,
+} from '../../src/modules/notifications/domain/models/task.model';
+
+describe('NotificationService', () => {
+  const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+  let service: NotificationService;
+  let mockTaskAnalyzer: { getDayOverview: jest.Mock };
+  let mockLlmAdapter: { generateContent: jest.Mock };
+  let mockProcessMessageService: { executeToolCalls: jest.Mock };
+
+  let taskCount = 0;
+  const task = (title: string, priority: TaskPriority, date: Date): Task =>
+    new Task(`task-${taskCount++}`, {
+      title,
+      date,
+      completed: false,
+      status: TaskStatus.TODO,
+      priority,
+      allDay: false,
+      type: 'single',
+      filePath: `${title}.md`,
+    });
+
+  // Tasks of one group share a date, so their scores tie exactly
+  const overdueTasks = (prefix: string, count: number, priority: TaskPriority, days: number) => {
+    const date = new Date(Date.now() - days * MS_PER_DAY);
+    return Array.from({ length: count }, (_, i) => task(`${prefix} ${i}`, priority, date));
+  };
+
+  // The digest data the LLM was asked to summarize
+  const digestPayload = (call = 0) =>
+    JSON.parse(mockLlmAdapter.generateContent.mock.calls[call][0][0].text);
+
+  beforeEach(() => {
+    mockTaskAnalyzer = { getDayOverview: jest.fn() };
+    mockLlmAdapter = {
+      generateContent: jest.fn().mockResolvedValue({
+        text: JSON.stringify([{ tool: 'reply', params: { message: 'Good morning!' } }]),
+      }),
+    };
+    mockProcessMessageService = { executeToolCalls: jest.fn().mockResolvedValue(undefined) };
+
+    const mockConfigService = { getTelegramUserIdNumbers: jest.fn().mockReturnValue([123]) };
+    const mockHistoryService = {
+      getRecentHistory: jest.fn().mockReturnValue([]),
+      appendEntry: jest.fn(),
+    };
+    const mockVaultService = { fileEvents: new EventEmitter() };
+
+    service = new NotificationService(
+      mockTaskAnalyzer as any,
+      {} as any,
+      mockConfigService as any,
+      mockLlmAdapter as any,
+      mockHistoryService as any,
+      {} as any,
+      {} as any,
+      mockVaultService as any,
+      mockProcessMessageService as any,
+    );
+  });
+
+  describe('sendMorningDigest', () => {
+    it('should pass only the top overdue tasks and the total overdue count', async () => {
+      // Arrange
+      const lowPriority = overdueTasks('Low', 20, TaskPriority.LOW, 1);
+      const urgent = overdueTasks('Urgent', 5, TaskPriority.HIGHEST, 10);
+      mockTaskAnalyzer.getDayOverview.mockResolvedValue({
+        todaysTasks: [],
+        overdueTasks: [...lowPriority, ...urgent],
+      });
+
+      // Act
+      const result = await service.sendMorningDigest(123);
+
+      // Assert
+      expect(result).toBe(true);
+      const payload = digestPayload();
+      expect(payload.overdueCount).toBe(25);
+      expect(payload.overdueTasks.map((summary: any) => summary.title)).toEqual([
+        ...urgent.map((overdue) => overdue.getTitle()),
+        ...lowPriority.slice(0, 15).map((overdue) => overdue.getTitle()),
+      ]);
+
+      const systemInstruction = mockLlmAdapter.generateContent.mock.calls[0][1];
+      expect(systemInstruction).toContain('top 20 overdue tasks');
+      expect(systemInstruction).toContain('"overdueCount" is the total');
+    });
+
+    it('should rank a recently slipped important task above a stale urgent one', async () => {
+      // Arrange
+      const stale = overdueTasks('Stale', 20, TaskPriority.HIGHEST, 30);
+      const recent = overdueTasks('Recent', 1, TaskPriority.HIGH, 1);
+      mockTaskAnalyzer.getDayOverview.mockResolvedValue({
+        todaysTasks: [],
+        overdueTasks: [...stale, ...recent],
+      });
+
+      // Act
+      await service.sendMorningDigest(123);
+
+      // Assert
+      const titles = digestPayload().overdueTasks.map((summary: any) => summary.title);
+      expect(titles).toHaveLength(20);
+      expect(titles[0]).toBe('Recent 0');
+      expect(titles).not.toContain('Stale 19');
+    });
+
+    it('should rank overdue tasks the same way when under the limit', async () => {
+      // Arrange
+      const overdue = [
+        ...overdueTasks('Low', 2, TaskPriority.LOW, 1),
+        ...overdueTasks('Urgent', 2, TaskPriority.HIGHEST, 3),
+      ];
+      mockTaskAnalyzer.getDayOverview.mockResolvedValue({ todaysTasks: [], overdueTasks: overdue });
+
+      // Act
+      await service.sendMorningDigest(123);
+
+      // Assert
+      const payload = digestPayload();
+      expect(payload.overdueCount).toBe(4);
+      expect(payload.overdueTasks.map((summary: any) => summary.title)).toEqual([
+        'Urgent 0',
+        'Urgent 1',
+        'Low 0',
+        'Low 1',
+      ]);
+    });
+
+    it('should rank tasks with an invalid priority or date last', async () => {
+      // Arrange
+      const lowPriority = overdueTasks('Low', 15, TaskPriority.LOW, 1);
+      const invalid = [
+        ...overdueTasks('No priority', 5, NaN as TaskPriority, 1),
+        task('No date', TaskPriority.HIGHEST, new Date(NaN)),
+      ];
+      const urgent = overdueTasks('Urgent', 5, TaskPriority.HIGHEST, 10);
+      mockTaskAnalyzer.getDayOverview.mockResolvedValue({
+        todaysTasks: [],
+        overdueTasks: [...invalid, ...lowPriority, ...urgent],
+      });
+
+      // Act
+      await service.sendMorningDigest(123);
+
+      // Assert
+      const payload = digestPayload();
+      expect(payload.overdueCount).toBe(26);
+      expect(payload.overdueTasks.map((summary: any) => summary.title)).toEqual([
+        ...urgent.map((overdue) => overdue.getTitle()),
+        ...lowPriority.map((overdue) => overdue.getTitle()),
+      ]);
+    });
+  });
+
+  describe('getCachedLlmResponse', () => {
+    const getCachedLlmResponse = (payload: unknown, generate: () => Promise<any>) =>
+      (service as any).getCachedLlmResponse('task-reminder', payload, generate);
+
+    beforeEach(() => {
+      mockTaskAnalyzer.getDayOverview.mockResolvedValue({
+        todaysTasks: [],
+        overdueTasks: overdueTasks('Low', 2, TaskPriority.LOW, 1),
+      });
+    });
+
+    it('should reuse the digest for identical requests', async () => {
+      // Act
+      await service.sendMorningDigest(123);
+      await service.sendMorningDigest(456);
+
+      // Assert
+      expect(mockLlmAdapter.generateContent).toHaveBeenCalledTimes(1);
+      expect(mockProcessMessageService.executeToolCalls).toHaveBeenCalledTimes(2);
+    });
+
+    it('should generate a new digest when the tasks change', async () => {
+      // Act
+      await service.sendMorningDigest(123);
+      mockTaskAnalyzer.getDayOverview.mockResolvedValue({
+        todaysTasks: [],
+        overdueTasks: overdueTasks('Other', 1, TaskPriority.LOW, 1),
+      });
+      await service.sendMorningDigest(123);
+
+      // Assert
+      expect(mockLlmAdapter.generateContent).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not keep a fallback digest produced after an LLM error', async () => {
+      // Arrange
+      mockLlmAdapter.generateContent.mockResolvedValueOnce(null);
+
+      // Act
+      await service.sendMorningDigest(123);
+      await service.sendMorningDigest(123);
+
+      // Assert
+      expect(mockLlmAdapter.generateContent).toHaveBeenCalledTimes(2);
+    });
+
+    it('should share one call between concurrent identical requests', async () => {
+      // Arrange
+      const generate = jest.fn().mockResolvedValue({ toolCalls: [] });
+
+      // Act
+      const [first, second] = await Promise.all([
+        getCachedLlmResponse('payload', generate),
+        getCachedLlmResponse('payload', generate),
+      ]);
+
+      // Assert
+      expect(generate).toHaveBeenCalledTimes(1);
+      expect(second).toBe(first);
+    });
+
+    it('should not keep a rejected generation', async () => {
+      // Arrange
+      const response = { toolCalls: [] };
+      const generate = jest
+        .fn()
+        .mockRejectedValueOnce(new Error('quota exceeded'))
+        .mockResolvedValueOnce(response);
+
+      // Act & Assert
+      await expect(getCachedLlmResponse('payload', generate)).rejects.toThrow('quota exceeded');
+      await expect(getCachedLlmResponse('payload', generate)).resolves.toBe(response);
+      expect(generate).toHaveBeenCalledTimes(2);
+    });
+  });
+});
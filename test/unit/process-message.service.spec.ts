@@ -0,0 +1,163 @@
+import { ProcessMessageService } from '../../src/modules/telegram/application/services/process-message.service';
+
+describe('ProcessMessageService', () => {
+  let service: ProcessMessageService;
+  let mockToolsRegistry: { executeTool: jest.Mock };
+  let mockVaultService: { readAllMarkdownFiles: jest.Mock; invalidateMarkdownFiles: jest.Mock };
+
+  const reply = (message: string, params: Record<string, any> = {}) => ({
+    tool: 'reply',
+    params: { message, ...params },
+  });
+
+  // Tool name and params of every executed call, in order
+  const executedCalls = () => mockToolsRegistry.executeTool.mock.calls;
+
+  beforeEach(() => {
+    mockToolsRegistry = { executeTool: jest.fn().mockResolvedValue({ status: 'success' }) };
+    mockVaultService = {
+      readAllMarkdownFiles: jest.fn().mockResolvedValue({}),
+      invalidateMarkdownFiles: jest.fn(),
+    };
+
+    service = new ProcessMessageService(
+      { processUserMessage: jest.fn() } as any,
+      mockVaultService as any,
+      mockToolsRegistry as any,
+    );
+  });
+
+  describe('executeToolCalls', () => {
+    it('should send consecutive replies as one message', async () => {
+      // Act
+      await service.executeToolCalls(
+        { toolCalls: [reply('First'), reply('Second'), reply('Third')] },
+        123,
+        456,
+      );
+
+      // Assert
+      expect(executedCalls()).toEqual([
+        ['reply', { message: 'First\n\nSecond\n\nThird', chat_id: 456, user_id: 123 }],
+      ]);
+    });
+
+    it('should keep replies apart when another tool runs between them', async () => {
+      // Arrange
+      const createFile = {
+        tool: 'create_file',
+        params: { file_path: 'todo.md', content: '# Todo' },
+      };
+
+      // Act
+      await service.executeToolCalls(
+        {
+          toolCalls: [reply('Creating'), createFile, reply('Done'), { tool: 'finish', params: {} }],
+        },
+        123,
+        456,
+      );
+
+      // Assert
+      expect(executedCalls().map(([tool, params]) => [tool, params.message])).toEqual([
+        ['reply', 'Creating'],
+        ['create_file', undefined],
+        ['reply', 'Done'],
+        ['finish', undefined],
+      ]);
+    });
+
+    it('should not merge replies to different recipients', async () => {
+      // Act
+      await service.executeToolCalls({
+        toolCalls: [
+          reply('To first chat', { chat_id: 1 }),
+          reply('Also to first chat', { chat_id: 1 }),
+          reply('To second chat', { chat_id: 2 }),
+        ],
+      });
+
+      // Assert
+      expect(executedCalls()).toEqual([
+        ['reply', { message: 'To first chat\n\nAlso to first chat', chat_id: 1 }],
+        ['reply', { message: 'To second chat', chat_id: 2 }],
+      ]);
+    });
+
+    it('should start a new message when merging would exceed the Telegram limit', async () => {
+      // Arrange
+      const long = 'a'.repeat(3000);
+      const short = 'b'.repeat(1000);
+
+      // Act
+      await service.executeToolCalls(
+        { toolCalls: [reply(long), reply(short), reply(long)] },
+        123,
+        456,
+      );
+
+      // Assert
+      const messages = executedCalls().map(([, params]) => params.message);
+      expect(messages).toEqual([`${long}\n\n${short}`, long]);
+      expect(messages.every((message) => message.length <= 4096)).toBe(true);
+    });
+
+    it('should run every file tool even when one fails', async () => {
+      // Arrange
+      mockToolsRegistry.executeTool.mockImplementation(async (tool, params) =>
+        params.file_path === 'broken.md'
+          ? { status: 'error', message: 'Permission denied' }
+          : { status: 'success' },
+      );
+
+      // Act
+      await service.executeToolCalls({
+        toolCalls: [
+          { tool: 'create_file', params: { file_path: 'broken.md', content: 'x' } },
+          { tool: 'create_file', params: { file_path: 'todo.md', content: 'y' } },
+          reply('Done'),
+        ],
+      });
+
+      // Assert
+      expect(executedCalls().map(([tool]) => tool)).toEqual([
+        'create_file',
+        'create_file',
+        'reply',
+      ]);
+      expect(mockVaultService.invalidateMarkdownFiles).toHaveBeenCalledTimes(1);
+    });
+
+    it('should run calls on the same file one after another', async () => {
+      // Arrange
+      const events: string[] = [];
+      mockToolsRegistry.executeTool.mockImplementation(async (tool, params) => {
+        events.push(`start ${params.content}`);
+        await new Promise((resolve) => setImmediate(resolve));
+        events.push(`end ${params.content}`);
+        return { status: 'success' };
+      });
+
+      // Act
+      await service.executeToolCalls({
+        toolCalls: [
+          { tool: 'create_file', params: { file_path: './Tasks/a.md', content: 'first' } },
+          { tool: 'modify_file', params: { file_path: 'Tasks//a.md', content: 'second' } },
+          { tool: 'create_file', params: { file_path: 'Tasks/b.md', content: 'other' } },
+        ],
+      });
+
+      // Assert
+      expect(events.indexOf('end first')).toBeLessThan(events.indexOf('start second'));
+      expect(events.indexOf('start other')).toBeLessThan(events.indexOf('end second'));
+    });
+
+    it('should keep the cached vault read when no file tool ran', async () => {
+      // Act
+      await service.executeToolCalls({ toolCalls: [reply('Hello')] }, 123, 456);
+
+      // Assert
+      expect(mockVaultService.invalidateMarkdownFiles).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -0,0 +1,64 @@
+import { SchedulerRegistry } from '@nestjs/schedule';
+import { SchedulingService } from '../../src/modules/notifications/infrastructure/services/scheduling.service';
+
+describe('SchedulingService', () => {
+  const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+  let service: SchedulingService;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    jest.setSystemTime(new Date('2024-01-01T09:00:00Z'));
+    service = new SchedulingService(new SchedulerRegistry());
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  describe('addOneTimeJob', () => {
+    it('should run a job further out than the setTimeout limit on time', () => {
+      // Arrange
+      const callback = jest.fn();
+
+      // Act
+      service.addOneTimeJob(new Date(Date.now() + 30 * MS_PER_DAY), 'reminder', callback);
+
+      // Assert
+      jest.advanceTimersByTime(30 * MS_PER_DAY - 1);
+      expect(callback).not.toHaveBeenCalled();
+      expect(service.getScheduledJobs()).toEqual(['reminder']);
+
+      jest.advanceTimersByTime(1);
+      expect(callback).toHaveBeenCalledTimes(1);
+      expect(service.getScheduledJobs()).toEqual([]);
+    });
+
+    it('should not run a long job unscheduled after its first wait', () => {
+      // Arrange
+      const callback = jest.fn();
+      service.addOneTimeJob(new Date(Date.now() + 60 * MS_PER_DAY), 'reminder', callback);
+      jest.advanceTimersByTime(40 * MS_PER_DAY);
+
+      // Act
+      const removed = service.unschedule('reminder');
+      jest.advanceTimersByTime(30 * MS_PER_DAY);
+
+      // Assert
+      expect(removed).toBe(true);
+      expect(callback).not.toHaveBeenCalled();
+    });
+
+    it('should run a job in the past right away', () => {
+      // Arrange
+      const callback = jest.fn();
+
+      // Act
+      service.addOneTimeJob(new Date(Date.now() - MS_PER_DAY), 'reminder', callback);
+      jest.advanceTimersByTime(0);
+
+      // Assert
+      expect(callback).toHaveBeenCalledTimes(1);
+    });
+  });
+});
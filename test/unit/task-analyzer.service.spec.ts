@@ -0,0 +1,150 @@
+import { TaskAnalyzerService } from '../../src/modules/notifications/infrastructure/services/task-analyzer.service';
+import { ConfigService } from '../../src/shared/infrastructure/config/config.service';
+import { IVaultService } from '../../src/modules/vault/domain/interfaces/vault-service.interface';
+
+describe('TaskAnalyzerService', () => {
+  const tasksFolder = '03 - Tasks';
+  let service: TaskAnalyzerService;
+  let files: Map<string, string>;
+  let mockVaultService: Partial<IVaultService>;
+
+  const taskFile = (title: string, date: string): string =>
+    `---\ntitle: ${title}\ndate: "${date}"\n---\n\n## 📝 Описание\n${title} description\n`;
+
+  // Titles of the uncompleted tasks dated before the given day, in snapshot order
+  const titlesBefore = async (date: Date): Promise<string[]> =>
+    (await service.getDayOverview(date)).overdueTasks.map((task) => task.getTitle());
+
+  beforeEach(() => {
+    files = new Map([
+      ['first.md', taskFile('First', '2024-01-10T12:00:00')],
+      ['second.md', taskFile('Second', '2024-01-12T12:00:00')],
+      ['third.md', taskFile('Third', '2024-01-14T12:00:00')],
+    ]);
+
+    mockVaultService = {
+      listFiles: jest.fn().mockImplementation(async () => [...files.keys()]),
+      readFile: jest
+        .fn()
+        .mockImplementation(async (filePath: string) =>
+          files.get(filePath.slice(tasksFolder.length + 1)),
+        ),
+    };
+
+    const mockConfigService: Partial<ConfigService> = {
+      getTasksFolder: jest.fn().mockReturnValue(tasksFolder),
+    };
+
+    service = new TaskAnalyzerService(
+      mockVaultService as IVaultService,
+      mockConfigService as ConfigService,
+    );
+  });
+
+  describe('getDayOverview', () => {
+    it('should keep every task of a large folder while bounding open reads', async () => {
+      // Arrange
+      files.clear();
+      for (let i = 0; i < 500; i++) {
+        const day = String((i % 28) + 1).padStart(2, '0');
+        files.set(`task-${i}.md`, taskFile(`Task ${i}`, `2024-01-${day}T12:00:00`));
+      }
+
+      // Like VaultService.readFile, an over-limit read fails and yields undefined
+      let openReads = 0;
+      let maxOpenReads = 0;
+      (mockVaultService.readFile as jest.Mock).mockImplementation(async (filePath: string) => {
+        const overLimit = ++openReads > 32;
+        maxOpenReads = Math.max(maxOpenReads, openReads);
+        await new Promise((resolve) => setImmediate(resolve));
+        openReads--;
+        return overLimit ? undefined : files.get(filePath.slice(tasksFolder.length + 1));
+      });
+
+      // Act
+      const overview = await service.getDayOverview(new Date(2024, 1, 1));
+
+      // Assert
+      expect(overview.overdueTasks).toHaveLength(500);
+      expect(maxOpenReads).toBeLessThanOrEqual(16);
+    });
+  });
+
+  describe('refreshTaskFile', () => {
+    const laterDay = new Date(2024, 0, 20);
+
+    it('should move a changed task to its new place in the sorted snapshot', async () => {
+      // Arrange
+      expect(await titlesBefore(laterDay)).toEqual(['First', 'Second', 'Third']);
+      files.set('first.md', taskFile('First', '2024-01-13T12:00:00'));
+
+      // Act
+      await service.refreshTaskFile(`${tasksFolder}/first.md`);
+
+      // Assert
+      expect(await titlesBefore(laterDay)).toEqual(['Second', 'First', 'Third']);
+      const tasksOnNewDate = await service.getTasksForDate(new Date(2024, 0, 13));
+      expect(tasksOnNewDate.map((task) => task.getTitle())).toEqual(['First']);
+      expect(await service.getTasksForDate(new Date(2024, 0, 10))).toEqual([]);
+    });
+
+    it('should insert a new task after tasks with the same date', async () => {
+      // Arrange
+      await titlesBefore(laterDay);
+      files.set('added.md', taskFile('Added', '2024-01-12T12:00:00'));
+
+      // Act
+      await service.refreshTaskFile(`${tasksFolder}/added.md`);
+
+      // Assert
+      expect(await titlesBefore(laterDay)).toEqual(['First', 'Second', 'Added', 'Third']);
+    });
+
+    it('should drop a deleted task from the snapshot', async () => {
+      // Arrange
+      await titlesBefore(laterDay);
+      files.delete('second.md');
+
+      // Act
+      await service.refreshTaskFile(`${tasksFolder}/second.md`);
+
+      // Assert
+      expect(await titlesBefore(laterDay)).toEqual(['First', 'Third']);
+      expect(await service.getTasksForDate(new Date(2024, 0, 12))).toEqual([]);
+    });
+
+    it('should not duplicate a task refreshed while the snapshot is loading', async () => {
+      // Arrange
+      const loading = titlesBefore(laterDay);
+      files.set('third.md', taskFile('Third', '2024-01-09T12:00:00'));
+
+      // Act
+      await service.refreshTaskFile(`${tasksFolder}/third.md`);
+      await loading;
+
+      // Assert
+      expect(await titlesBefore(laterDay)).toEqual(['Third', 'First', 'Second']);
+    });
+
+    it('should ignore files outside the tasks folder', async () => {
+      // Arrange
+      await titlesBefore(laterDay);
+      (mockVaultService.readFile as jest.Mock).mockClear();
+
+      // Act
+      await service.refreshTaskFile('Notes/first.md');
+
+      // Assert
+      expect(mockVaultService.readFile).not.toHaveBeenCalled();
+      expect(await titlesBefore(laterDay)).toEqual(['First', 'Second', 'Third']);
+    });
+
+    it('should not read the file before any snapshot was loaded', async () => {
+      // Act
+      await service.refreshTaskFile(`${tasksFolder}/first.md`);
+
+      // Assert
+      expect(mockVaultService.readFile).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -0,0 +1,67 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { VaultService } from '../../src/modules/vault/infrastructure/services/vault.service';
+import { ConfigService } from '../../src/shared/infrastructure/config/config.service';
+
+describe('VaultService', () => {
+  let vaultRoot: string;
+  let service: VaultService;
+
+  const writeNote = (relativePath: string, content: string) => {
+    const absolutePath = path.join(vaultRoot, relativePath);
+    fs.mkdirSync(path.dirname(absolutePath), { recursive: true });
+    fs.writeFileSync(absolutePath, content);
+  };
+
+  // Markdown paths depth first in the order the file system lists each directory
+  const listingOrder = (relativePath = ''): string[] =>
+    fs
+      .readdirSync(path.join(vaultRoot, relativePath), { withFileTypes: true })
+      .flatMap((entry) => {
+        const entryPath = path.join(relativePath, entry.name);
+        if (entry.isDirectory()) return listingOrder(entryPath);
+        return entry.name.endsWith('.md') ? [entryPath] : [];
+      });
+
+  beforeEach(() => {
+    vaultRoot = fs.mkdtempSync(path.join(os.tmpdir(), 'vault-service-'));
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+
+    const mockConfigService: Partial<ConfigService> = {
+      getObsidianVaultPath: jest.fn().mockReturnValue(vaultRoot),
+    };
+    service = new VaultService(mockConfigService as ConfigService);
+  });
+
+  afterEach(() => {
+    (service as any).watcher?.close();
+    jest.restoreAllMocks();
+    fs.rmSync(vaultRoot, { recursive: true, force: true });
+  });
+
+  describe('readAllMarkdownFiles', () => {
+    it('should read every note of a nested vault in directory listing order', async () => {
+      // Arrange
+      for (let i = 0; i < 40; i++) {
+        writeNote(`note-${i}.md`, `# Note ${i}`);
+        writeNote(path.join('Projects', `project-${i}.md`), `# Project ${i}`);
+        writeNote(path.join('Projects', 'Archive', `old-${i}.md`), `# Old ${i}`);
+      }
+      writeNote(path.join('Attachments', 'image.png'), 'not a note');
+
+      // Act
+      const files = await service.readAllMarkdownFiles();
+
+      // Assert
+      expect(Object.keys(files)).toEqual(listingOrder());
+      expect(Object.keys(files)).toHaveLength(120);
+      expect(files[path.join('Projects', 'Archive', 'old-7.md')]).toBe('# Old 7');
+    });
+
+    it('should return an empty record for an empty vault', async () => {
+      // Act & Assert
+      await expect(service.readAllMarkdownFiles()).resolves.toEqual({});
+    });
+  });
+});